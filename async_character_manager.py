@@ -0,0 +1,98 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Async Character Manager Module
+
+asyncio versions of the character persistence functions. File work runs
+on a bounded thread pool so the event loop never blocks on disk I/O, and
+a per-directory semaphore caps how many operations hit the same save
+directory at once. Everything else (backends, journal mode, manifest)
+behaves exactly like the synchronous character_manager functions.
+
+Example:
+    await asyncio.gather(*(save_character(c) for c in characters))
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import character_manager
+
+MAX_WORKERS = 8
+PER_DIRECTORY_LIMIT = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+_semaphores = weakref.WeakKeyDictionary()  # event loop -> {directory: Semaphore}
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                           thread_name_prefix="character-io")
+        return _executor
+
+
+def _directory_semaphore(save_directory):
+    loop = asyncio.get_running_loop()
+    per_loop = _semaphores.setdefault(loop, {})
+    key = os.path.abspath(save_directory)
+    if key not in per_loop:
+        per_loop[key] = asyncio.Semaphore(PER_DIRECTORY_LIMIT)
+    return per_loop[key]
+
+
+async def _run(save_directory, func, *args, **kwargs):
+    """Run a blocking character_manager call on the pool, limited per directory"""
+    async with _directory_semaphore(save_directory):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+
+async def save_character(character, save_directory="data/save_games", journal=False,
+                         storage=None, binary=False):
+    """
+    Save a character without blocking the event loop
+
+    The character is snapshotted before the call returns control, so later
+    changes made on the loop cannot tear the save.
+    """
+    snapshot = character.copy()
+    for key in character_manager.LIST_FIELDS:
+        snapshot[key] = list(character[key])
+    return await _run(save_directory, character_manager.save_character,
+                      snapshot, save_directory, journal, storage=storage, binary=binary)
+
+
+async def load_character(character_name, save_directory="data/save_games", storage=None):
+    """Load a character without blocking the event loop"""
+    return await _run(save_directory, character_manager.load_character,
+                      character_name, save_directory, storage=storage)
+
+
+async def list_saved_characters(save_directory="data/save_games", storage=None):
+    """List saved characters without blocking the event loop"""
+    return await _run(save_directory, character_manager.list_saved_characters,
+                      save_directory, storage=storage)
+
+
+async def delete_character(character_name, save_directory="data/save_games", storage=None):
+    """Delete a saved character without blocking the event loop"""
+    return await _run(save_directory, character_manager.delete_character,
+                      character_name, save_directory, storage=storage)
+
+
+def shutdown():
+    """Wait for running file work and release the worker threads"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
@@ -0,0 +1,145 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Batch Combat Module
+
+This module auto-resolves many battles at once. The health, strength,
+magic and level of N player/enemy pairs are held in arrays, and each turn
+applies the calculate_damage formula and the class specials to every pair
+that is still fighting in a handful of vectorized operations. Each pair
+repeats one move ("attack", "special" or "run") every turn, and the
+results match running SimpleBattle with that move as the player strategy.
+
+NumPy is used when it is installed; otherwise every pair is resolved with
+the scalar combat_system engine.
+"""
+
+from custom_exceptions import CharacterDeadError
+from combat_system import DEFAULT_MAX_TURNS, SimpleBattle, get_victory_rewards
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ACTION_CODES = {"attack": 0, "special": 1, "run": 2}
+CLASS_CODES = {"Warrior": 0, "Mage": 1, "Rogue": 2, "Cleric": 3}  # anything else: no special
+WINNERS = ("none", "player", "enemy")
+CLERIC_HEAL = 30  # Same as combat_system.cleric_heal
+
+
+def resolve_battles(characters, enemies, actions="attack", max_turns=DEFAULT_MAX_TURNS):
+    """
+    Resolve character[i] vs enemies[i] for every pair
+
+    Like SimpleBattle.start_battle, the final health is written back to
+    each character and enemy.
+
+    Args:
+        characters: Sequence of characters
+        enemies: Sequence of enemies, one per character
+        actions: Move every player repeats, or a sequence with one move per pair
+        max_turns: Turns after which a battle ends with no winner
+
+    Returns: List of {'winner', 'xp_gained', 'gold_gained'} dictionaries, in pair order
+    Raises: CharacterDeadError if any character is already dead
+            ValueError on mismatched lengths or an unknown action
+    """
+    if len(characters) != len(enemies):
+        raise ValueError("Need exactly one enemy per character")
+    if isinstance(actions, str):
+        actions = [actions] * len(characters)
+    elif len(actions) != len(characters):
+        raise ValueError("Need exactly one action per character")
+    for action in set(actions):
+        if action not in ACTION_CODES:
+            raise ValueError(f"Unknown battle action: {action}")
+    for index, character in enumerate(characters):
+        if character["health"] <= 0:
+            raise CharacterDeadError(f"Character {index} is already dead, cannot start battle.")
+
+    if np is None:
+        return [_resolve_scalar(character, enemy, action, max_turns)
+                for character, enemy, action in zip(characters, enemies, actions)]
+    return _resolve_vectorized(characters, enemies, actions, max_turns)
+
+
+def _discard_event(event):
+    pass
+
+
+def _resolve_scalar(character, enemy, action, max_turns):
+    battle = SimpleBattle(character, enemy, player_strategy=lambda battle: action,
+                          event_sink=_discard_event, max_turns=max_turns)
+    return battle.start_battle()
+
+
+def _column(records, key):
+    return np.fromiter((record[key] for record in records), dtype=np.int64, count=len(records))
+
+
+def _resolve_vectorized(characters, enemies, actions, max_turns):
+    count = len(characters)
+    player_health = _column(characters, "health")
+    player_max = _column(characters, "max_health")
+    player_strength = _column(characters, "strength")
+    player_magic = _column(characters, "magic")
+    player_level = _column(characters, "level")
+    player_class = np.fromiter((CLASS_CODES.get(c["class"], -1) for c in characters),
+                               dtype=np.int8, count=count)
+    enemy_health = _column(enemies, "health")
+    enemy_strength = _column(enemies, "strength")
+    action = np.fromiter((ACTION_CODES[a] for a in actions), dtype=np.int8, count=count)
+
+    # Per-pair constants: the damage formulas only depend on strength
+    attack_damage = np.maximum(player_strength - enemy_strength // 4, 1)
+    enemy_damage = np.maximum(enemy_strength - player_strength // 4, 1)
+    can_escape = player_level >= enemy_strength // 5
+    heals = (action == 1) & (player_class == 3)
+
+    winner = np.zeros(count, dtype=np.int8)  # Index into WINNERS
+    active = np.arange(count)
+    for _ in range(max_turns):
+        if not active.size:
+            break
+        act = action[active]
+        cls = player_class[active]
+        strength = player_strength[active]
+        e_health = enemy_health[active]
+        p_health = player_health[active]
+
+        # Player turn
+        special = act == 1
+        damage = np.where(act == 0, attack_damage[active], 0)
+        damage = np.where(special & (cls == 0), strength * 2, damage)
+        damage = np.where(special & (cls == 1), player_magic[active] * 2, damage)
+        crit = np.where(e_health % 2 == 0, strength * 3, strength)
+        damage = np.where(special & (cls == 2), crit, damage)
+        e_health = np.maximum(e_health - damage, 0)
+        heal = heals[active]
+        p_health = np.where(heal, np.minimum(p_health + CLERIC_HEAL, player_max[active]), p_health)
+
+        escaped = (act == 2) & can_escape[active]
+        player_won = ~escaped & (e_health <= 0)
+        fighting = ~(escaped | player_won)
+
+        # Enemy turn, only where the battle is still on
+        p_health = np.where(fighting, np.maximum(p_health - enemy_damage[active], 0), p_health)
+        enemy_won = fighting & (p_health <= 0)
+
+        enemy_health[active] = e_health
+        player_health[active] = p_health
+        winner[active[player_won]] = 1
+        winner[active[enemy_won]] = 2
+        active = active[fighting & ~enemy_won]
+
+    results = []
+    for index, (character, enemy) in enumerate(zip(characters, enemies)):
+        character["health"] = int(player_health[index])
+        enemy["health"] = int(enemy_health[index])
+        if winner[index] == 1:
+            rewards = get_victory_rewards(enemy)
+            results.append({"winner": "player", "xp_gained": rewards["xp"],
+                            "gold_gained": rewards["gold"]})
+        else:
+            results.append({"winner": WINNERS[winner[index]], "xp_gained": 0, "gold_gained": 0})
+    return results
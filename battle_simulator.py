@@ -0,0 +1,159 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+This module runs Monte Carlo battles for every (class, level, enemy type)
+combination so stat changes to character_manager.CLASS_STATS or
+data/enemies.txt can be checked against numbers instead of guesswork.
+Combinations are spread over a process pool; each one gets its own random
+generator seeded from the run seed and the combination, so results are
+identical no matter how many workers run them.
+
+Usage:
+    python battle_simulator.py                  # all classes, default levels
+    python battle_simulator.py --battles 2000 --levels 1 5 10 --seed 7
+"""
+
+import os
+import sys
+import json
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import character_manager
+import combat_system
+from progression import apply_experience, experience_for_level
+
+DEFAULT_LEVELS = (1, 3, 6, 10)
+DEFAULT_BATTLES = 500
+SPECIAL_RATE = 0.3  # Chance the simulated player uses their special ability
+HP_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def _discard_event(event):
+    pass
+
+
+def _leveled_character(character_class, level):
+    """Fresh character of a class, leveled up the way experience would"""
+    character = character_manager.create_character(f"Sim{character_class}", character_class)
+    apply_experience(character, experience_for_level(level))
+    return character
+
+
+def simulate_matchup(character_class, level, enemy_type, battles=DEFAULT_BATTLES,
+                     seed=0, special_rate=SPECIAL_RATE,
+                     max_turns=combat_system.DEFAULT_MAX_TURNS):
+    """
+    Run repeated battles for one (class, level, enemy type) combination
+
+    The simulated player attacks, or uses their special ability with
+    probability special_rate. Each battle's seed is drawn from a generator
+    seeded from seed and the combination, so a matchup gives the same
+    summary in any process and any single battle can be replayed.
+
+    Returns: Summary dictionary with win_rate, a turn-count histogram and
+             percentiles of the player's remaining HP (percent of max)
+    """
+    rng = random.Random(f"{seed}:{character_class}:{level}:{enemy_type}")
+
+    def strategy(battle):
+        return "special" if battle.rng.random() < special_rate else "attack"
+
+    template = _leveled_character(character_class, level)
+    results = Counter()
+    turns = Counter()
+    hp_remaining = []
+    for _ in range(battles):
+        character = template.copy()  # Lists are shared but battles never touch them
+        battle = combat_system.SimpleBattle(
+            character, combat_system.create_enemy(enemy_type),
+            player_strategy=strategy, event_sink=_discard_event, max_turns=max_turns,
+            seed=rng.getrandbits(64))
+        results[battle.start_battle()["winner"]] += 1
+        turns[battle.turn_counter - 1] += 1
+        hp_remaining.append(100 * character["health"] // character["max_health"])
+
+    hp_remaining.sort()
+    return {
+        "class": character_class,
+        "level": level,
+        "enemy": enemy_type,
+        "battles": battles,
+        "wins": results["player"],
+        "losses": results["enemy"],
+        "draws": results["none"],
+        "win_rate": results["player"] / battles if battles else 0.0,
+        "turns": dict(sorted(turns.items())),
+        "hp_remaining_percentiles": {p: _percentile(hp_remaining, p) for p in HP_PERCENTILES}
+    }
+
+
+def _simulate_task(task):
+    return simulate_matchup(*task)
+
+
+def run_simulation(classes=None, levels=DEFAULT_LEVELS, enemy_types=None,
+                   battles=DEFAULT_BATTLES, seed=0, special_rate=SPECIAL_RATE,
+                   max_turns=combat_system.DEFAULT_MAX_TURNS, max_workers=None):
+    """
+    Simulate every (class, level, enemy type) combination
+
+    Args:
+        classes: Character classes (default: every class in CLASS_STATS)
+        levels: Character levels to test
+        enemy_types: Enemy types (default: every enemy in data/enemies.txt)
+        battles: Battles per combination
+        seed: Run seed; the same seed always gives the same report
+        max_workers: Process pool size (default: CPU count; 1 runs in-process)
+
+    Returns: List of simulate_matchup summaries, in combination order
+    """
+    classes = list(classes or character_manager.CLASS_STATS)
+    enemy_types = list(enemy_types or combat_system.get_enemy_registry())
+    tasks = [(character_class, level, enemy_type, battles, seed, special_rate, max_turns)
+             for character_class in classes
+             for level in levels
+             for enemy_type in enemy_types]
+
+    if max_workers is None:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+
+    if len(tasks) <= 1 or max_workers <= 1:
+        return [_simulate_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_simulate_task, tasks, chunksize=max(1, len(tasks) // (max_workers * 4))))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Monte Carlo battle balance report")
+    parser.add_argument("--classes", nargs="+")
+    parser.add_argument("--levels", nargs="+", type=int, default=list(DEFAULT_LEVELS))
+    parser.add_argument("--enemies", nargs="+")
+    parser.add_argument("--battles", type=int, default=DEFAULT_BATTLES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    report = run_simulation(args.classes, args.levels, args.enemies, args.battles,
+                            args.seed, max_workers=args.workers)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for row in report:
+            hp = row["hp_remaining_percentiles"]
+            print(f"{row['class']:<8} L{row['level']:<3} vs {row['enemy']:<7} "
+                  f"win {row['win_rate']:6.1%}  HP% p10/p50/p90 {hp[10]}/{hp[50]}/{hp[90]}")
@@ -0,0 +1,193 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Data Loader Benchmarks
+
+Generates synthetic quest and item files of increasing size and measures
+wall time, records/sec and peak traced memory for load_quests, load_items,
+validate_quest_data and validate_item_data. Results are written as JSON so
+runs from different releases can be diffed (or compared with --compare).
+
+Usage:
+    python benchmarks/bench_game_data.py
+    python benchmarks/bench_game_data.py --sizes 10 1000 100000 --output new.json
+    python benchmarks/bench_game_data.py --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+def write_quest_file(path, count):
+    """Write count synthetic quests, each requiring the previous one"""
+    with open(path, "w") as f:
+        for i in range(count):
+            prereq = f"quest_{i - 1}" if i else "NONE"
+            f.write(
+                f"QUEST_ID: quest_{i}\n"
+                f"TITLE: Synthetic Quest {i}\n"
+                f"DESCRIPTION: Defeat {i % 7 + 1} synthetic enemies near town {i % 13}\n"
+                f"REWARD_XP: {50 + i % 500}\n"
+                f"REWARD_GOLD: {10 + i % 200}\n"
+                f"REQUIRED_LEVEL: {1 + i % 50}\n"
+                f"PREREQUISITE: {prereq}\n\n"
+            )
+
+
+def write_item_file(path, count):
+    """Write count synthetic items cycling through every item type"""
+    types = [("weapon", "strength"), ("armor", "max_health"), ("consumable", "health")]
+    with open(path, "w") as f:
+        for i in range(count):
+            item_type, stat = types[i % 3]
+            f.write(
+                f"ITEM_ID: item_{i}\n"
+                f"NAME: Synthetic Item {i}\n"
+                f"TYPE: {item_type}\n"
+                f"EFFECT: {stat}:{1 + i % 25}\n"
+                f"COST: {5 + i % 400}\n"
+                f"DESCRIPTION: A synthetic {item_type} for benchmarking\n\n"
+            )
+
+
+def quest_dicts(count):
+    return [{
+        "quest_id": f"quest_{i}", "title": "t", "description": "d",
+        "reward_xp": "100", "reward_gold": "50", "required_level": "3",
+        "prerequisite": "NONE"
+    } for i in range(count)]
+
+
+def item_dicts(count):
+    return [{
+        "item_id": f"item_{i}", "name": "n", "type": "weapon",
+        "effect": "strength:5", "cost": "100", "description": "d"
+    } for i in range(count)]
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def measure(func, records, repeat):
+    """
+    Time func() (best of repeat runs) and trace its peak memory separately
+
+    Returns: Dictionary with seconds, records_per_sec and peak_bytes
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": round(best, 6),
+        "records_per_sec": round(records / best, 1) if best else None,
+        "peak_bytes": peak
+    }
+
+
+def run_size(count, workdir, repeat):
+    """Run every benchmark for one record count"""
+    quest_file = os.path.join(workdir, f"quests_{count}.txt")
+    item_file = os.path.join(workdir, f"items_{count}.txt")
+    write_quest_file(quest_file, count)
+    write_item_file(item_file, count)
+
+    # Records are built once so only validation is timed; later repeats see
+    # already-converted integers, which is the steady state in the game.
+    quests = quest_dicts(count)
+    items = item_dicts(count)
+
+    def validate_quests():
+        for quest in quests:
+            game_data.validate_quest_data(quest)
+
+    def validate_items():
+        for item in items:
+            game_data.validate_item_data(item)
+
+    results = {
+        "load_quests": measure(lambda: game_data.load_quests(quest_file), count, repeat),
+        "load_items": measure(lambda: game_data.load_items(item_file), count, repeat),
+        "validate_quest_data": measure(validate_quests, count, repeat),
+        "validate_item_data": measure(validate_items, count, repeat),
+    }
+    os.remove(quest_file)
+    os.remove(item_file)
+    return results
+
+
+def compare(old_results, new_results):
+    """Print the time ratio new/old for every benchmark present in both runs"""
+    print(f"\n{'records':>10}  {'benchmark':<22}{'old s':>12}{'new s':>12}{'ratio':>8}")
+    for count, benchmarks in new_results["results"].items():
+        old_benchmarks = old_results["results"].get(count, {})
+        for name, new in benchmarks.items():
+            old = old_benchmarks.get(name)
+            if not old or not old["seconds"]:
+                continue
+            ratio = new["seconds"] / old["seconds"]
+            print(f"{count:>10}  {name:<22}{old['seconds']:>12.4f}{new['seconds']:>12.4f}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark game_data loaders")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="record counts to generate (default: 10 .. 1,000,000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per benchmark; the best is kept")
+    parser.add_argument("--output", default="bench_output.json",
+                        help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="OLD_JSON",
+                        help="print time ratios against a previous results file")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {}
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in args.sizes:
+            results = run_size(count, workdir, args.repeat)
+            report["results"][str(count)] = results
+            for name, result in results.items():
+                print(f"{count:>10}  {name:<22}{result['seconds']:>10.4f}s"
+                      f"{result['records_per_sec'] or 0:>14,.0f} rec/s"
+                      f"{result['peak_bytes'] / 1024:>12,.0f} KiB peak")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Format Benchmarks
+
+Compares the KEY: VALUE text save format with the binary save format:
+time to save and load N characters, time to decode them from memory
+(parsing cost alone), and bytes on disk per character.
+
+Usage:
+    python benchmarks/bench_save_formats.py
+    python benchmarks/bench_save_formats.py --characters 5000 --items 200 --output saves.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def make_characters(count, items):
+    """Build characters with sizeable inventories and quest histories"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    characters = []
+    for i in range(count):
+        char = character_manager.create_character(f"Bench{i}", classes[i % 4])
+        char['level'] = 1 + i % 60
+        char['gold'] = 1000 + i
+        char['inventory'] = [f"item_{(i + j) % 150}" for j in range(items)]
+        char['completed_quests'] = [f"quest_{j}" for j in range(items // 2)]
+        char['active_quests'] = [f"quest_{items + j}" for j in range(3)]
+        characters.append(char)
+    return characters
+
+
+def bench_format(characters, save_directory, binary):
+    """Save then load every character; return timings and size on disk"""
+    start = time.perf_counter()
+    for char in characters:
+        character_manager.save_character(char, save_directory, binary=binary)
+    save_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for char in characters:
+        loaded = character_manager.load_character(char['name'], save_directory)
+    load_seconds = time.perf_counter() - start
+    assert loaded['inventory'] == characters[-1]['inventory']
+
+    # Encode/decode alone, without file system overhead
+    encode = character_manager._encode_binary if binary else (
+        lambda char: character_manager._format_text_save(char).encode())
+    blobs = [encode(char) for char in characters]
+    start = time.perf_counter()
+    for blob in blobs:
+        character_manager._decode_save(blob)
+    decode_seconds = time.perf_counter() - start
+
+    total_bytes = sum(
+        os.path.getsize(os.path.join(save_directory, f"{char['name']}.txt"))
+        for char in characters
+    )
+    return {
+        "save_seconds": round(save_seconds, 6),
+        "load_seconds": round(load_seconds, 6),
+        "loads_per_sec": round(len(characters) / load_seconds, 1),
+        "decode_seconds": round(decode_seconds, 6),
+        "bytes_per_character": round(total_bytes / len(characters), 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark text vs binary saves")
+    parser.add_argument("--characters", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100,
+                        help="inventory entries per character")
+    parser.add_argument("--output", default="bench_save_formats.json")
+    args = parser.parse_args(argv)
+
+    characters = make_characters(args.characters, args.items)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "characters": args.characters,
+        "items": args.items,
+        "results": {}
+    }
+    for name, binary in [("text", False), ("binary", True)]:
+        with tempfile.TemporaryDirectory() as save_directory:
+            result = bench_format(characters, save_directory, binary)
+        report["results"][name] = result
+        print(f"{name:<8} save {result['save_seconds']:.4f}s  load {result['load_seconds']:.4f}s  "
+              f"({result['loads_per_sec']:,.0f} loads/s)  decode {result['decode_seconds']:.4f}s  "
+              f"{result['bytes_per_character']:,.0f} B/char")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,19 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import sys
+import json
+import hashlib
+import time
+import zlib
+import struct
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from operator import itemgetter
+from progression import apply_experience
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
@@ -21,21 +34,23 @@ from custom_exceptions import (
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
-def create_character(name, character_class):
-    stats_classes = {
-        "Warrior": {"health": 120, "strength": 15, "magic": 3},
-        "Mage": {"health": 80, "strength": 5, "magic": 20},
-        "Rogue": {"health": 100, "strength": 12, "magic": 8},
-        "Cleric": {"health": 90, "strength": 8, "magic": 15}  # Added Cleric
-    }
+# Starting stats per class (battle_simulator reads this for balance runs)
+CLASS_STATS = {
+    "Warrior": {"health": 120, "strength": 15, "magic": 3},
+    "Mage": {"health": 80, "strength": 5, "magic": 20},
+    "Rogue": {"health": 100, "strength": 12, "magic": 8},
+    "Cleric": {"health": 90, "strength": 8, "magic": 15}  # Added Cleric
+}
 
+
+def create_character(name, character_class):
     # Check if the class exists
-    if character_class not in stats_classes:
+    if character_class not in CLASS_STATS:
         raise InvalidCharacterClassError(f"Invalid class: {character_class}")
 
-    stats = stats_classes[character_class]
+    stats = CLASS_STATS[character_class]
     DEFAULT_STARTING_GOLD = 100  
-    character = {
+    character = Character({
         "name": name,
         "class": character_class,
         "level": 1,
@@ -48,52 +63,405 @@ def create_character(name, character_class):
         "inventory": [],
         "active_quests": [],
         "completed_quests": []
-    }
+    })
 
     return character
 
-def save_character(character, save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        os.makedirs(save_directory)
+SAVE_FIELDS = (
+    "name", "class", "level", "health", "max_health", "strength", "magic",
+    "experience", "gold", "inventory", "active_quests", "completed_quests"
+)
+INT_FIELDS = ("level", "health", "max_health", "strength", "magic", "experience", "gold")
+LIST_FIELDS = ("inventory", "active_quests", "completed_quests")
+EQUIPMENT_FIELDS = ("equipped_weapon", "equipped_armor")
+_CHARACTER_SLOTS = SAVE_FIELDS + EQUIPMENT_FIELDS
+_CHARACTER_SLOT_SET = frozenset(_CHARACTER_SLOTS)
 
-    file_path = os.path.join(save_directory, f"{character['name']}.txt")
 
-    inventory_csv = ",".join(character["inventory"])
-    active_csv = ",".join(character["active_quests"])
-    completed_csv = ",".join(character["completed_quests"])
+class Character(MutableMapping):
+    """
+    A player character with dictionary-style access
+
+    The saved fields and the equipment fields live in slots instead of a
+    per-character dict, so a resident character takes about half the memory
+    of the plain dictionary. The trade-off is CPU: every item access runs a
+    Python-level __getitem__/__setitem__, so character["gold"] reads are
+    about 2x and writes about 3x slower than on a dict. Hot loops should
+    copy a field into a local. Any other key is kept in a small extras dict
+    created on first use. character["gold"], .get(), .setdefault(), "in",
+    del, update() and iteration behave like the plain dictionary used
+    before; a field that was never set (for example one missing from a save
+    file) is absent rather than None.
+    """
+
+    __slots__ = _CHARACTER_SLOTS + ("_extras",)
+
+    def __init__(self, *args, **kwargs):
+        self._extras = None
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        if key in _CHARACTER_SLOT_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extras is not None:
+            return self._extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _CHARACTER_SLOT_SET:
+            setattr(self, key, value)
+        elif self._extras is None:
+            self._extras = {key: value}
+        else:
+            self._extras[key] = value
+
+    def __delitem__(self, key):
+        if key in _CHARACTER_SLOT_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extras is not None:
+            del self._extras[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _CHARACTER_SLOT_SET:
+            return hasattr(self, key)
+        return self._extras is not None and key in self._extras
+
+    def __iter__(self):
+        for field in _CHARACTER_SLOTS:
+            if hasattr(self, field):
+                yield field
+        if self._extras:
+            yield from self._extras
+
+    def __len__(self):
+        count = sum(1 for field in _CHARACTER_SLOTS if hasattr(self, field))
+        return count + (len(self._extras) if self._extras else 0)
+
+    def get(self, key, default=None):
+        if key in _CHARACTER_SLOT_SET:
+            return getattr(self, key, default)
+        if self._extras is None:
+            return default
+        return self._extras.get(key, default)
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        return Character(self)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __repr__(self):
+        return f"Character({dict(self)!r})"
+
+# Journaled saves append changed fields to <name>.journal and fold the
+# journal back into the <name>.txt snapshot once it grows past either limit.
+JOURNAL_MAX_ENTRIES = 50
+JOURNAL_MAX_BYTES = 16 * 1024
+_journal_state = {}  # snapshot path -> {"saved": last saved fields, "entries": count}
+_journal_lock = threading.RLock()  # Saves may run on worker threads
+
+
+def _journal_path(file_path):
+    return file_path[:-4] + ".journal"
+
+
+def _saved_fields(character):
+    """Copy of the persisted fields, with lists copied too"""
+    return {key: list(character[key]) if key in LIST_FIELDS else character[key]
+            for key in SAVE_FIELDS}
+
+
+# Binary saves: magic, version byte and the integer stats in one fixed
+# struct header, then length-prefixed name and class, a string table shared
+# by the inventory and quest lists (one NUL-separated blob), the three lists
+# as table indices, and a trailing CRC32 of everything before it.
+# load_character detects the format from the magic bytes, so text and
+# binary saves can sit side by side.
+BINARY_MAGIC = b"QCSB"
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct(f"<4sB{len(INT_FIELDS)}q")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+
+def _index_code(table_size):
+    """Smallest struct code that can hold every string table index"""
+    if table_size <= 0xFF:
+        return "B"
+    if table_size <= 0xFFFF:
+        return "H"
+    return "I"
+
+
+def _encode_binary(character):
+    """Pack a character into the binary save format"""
+    positions = {}
+    lists = []
+    for field in LIST_FIELDS:
+        lists.append([positions.setdefault(value, len(positions)) for value in character[field]])
+
+    name = character["name"].encode()
+    char_class = character["class"].encode()
+    table = "\0".join(positions).encode()
+    code = _index_code(len(positions))
+
+    parts = [
+        _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                            *(character[field] for field in INT_FIELDS)),
+        _U16.pack(len(name)), name,
+        _U16.pack(len(char_class)), char_class,
+        _U32.pack(len(positions)), _U32.pack(len(table)), table,
+    ]
+    for indices in lists:
+        parts.append(_U32.pack(len(indices)))
+        parts.append(struct.pack(f"<{len(indices)}{code}", *indices))
+
+    payload = b"".join(parts)
+    return payload + _U32.pack(zlib.crc32(payload))
+
+
+def _decode_binary(data):
+    """
+    Unpack a binary save
+
+    Raises: SaveFileCorruptedError on a bad checksum, unknown version or
+            truncated data
+    """
+    if len(data) < _BINARY_HEADER.size + _U32.size:
+        raise SaveFileCorruptedError("Binary save file is truncated")
+    payload = memoryview(data)[:-_U32.size]
+    (checksum,) = _U32.unpack_from(data, len(data) - _U32.size)
+    if zlib.crc32(payload) != checksum:
+        raise SaveFileCorruptedError("Binary save file failed its checksum")
 
     try:
-        with open(file_path, "w") as f:
-            f.write(f"NAME: {character['name']}\n")
-            f.write(f"CLASS: {character['class']}\n")
-            f.write(f"LEVEL: {character['level']}\n")
-            f.write(f"HEALTH: {character['health']}\n")
-            f.write(f"MAX_HEALTH: {character['max_health']}\n")
-            f.write(f"STRENGTH: {character['strength']}\n")
-            f.write(f"MAGIC: {character['magic']}\n")
-            f.write(f"EXPERIENCE: {character['experience']}\n")
-            f.write(f"GOLD: {character['gold']}\n")
-            f.write(f"INVENTORY: {inventory_csv}\n")
-            f.write(f"ACTIVE_QUESTS: {active_csv}\n")
-            f.write(f"COMPLETED_QUESTS: {completed_csv}\n")
+        header = _BINARY_HEADER.unpack_from(payload, 0)
+        if header[1] != BINARY_VERSION:
+            raise SaveFileCorruptedError(f"Unsupported binary save version {header[1]}")
+        character = Character(zip(INT_FIELDS, header[2:]))
+        offset = _BINARY_HEADER.size
+
+        for field in ("name", "class"):
+            (length,) = _U16.unpack_from(payload, offset)
+            offset += _U16.size
+            character[field] = bytes(payload[offset:offset + length]).decode()
+            offset += length
+
+        count, length = struct.unpack_from("<II", payload, offset)
+        offset += 8
+        strings = bytes(payload[offset:offset + length]).decode().split("\0") if count else []
+        strings = list(map(sys.intern, strings))
+        offset += length
+        if len(strings) != count:
+            raise SaveFileCorruptedError("Binary save string table is corrupted")
+
+        code = _index_code(count)
+        width = struct.calcsize(code)
+        for field in LIST_FIELDS:
+            (count,) = _U32.unpack_from(payload, offset)
+            offset += _U32.size
+            indices = struct.unpack_from(f"<{count}{code}", payload, offset)
+            offset += width * count
+            if count > 1:
+                character[field] = list(itemgetter(*indices)(strings))
+            else:
+                character[field] = [strings[index] for index in indices]
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise SaveFileCorruptedError(f"Binary save file is corrupted: {e}")
+
+    return character
+
+
+def _write_snapshot(character, file_path, journal=False, binary=False):
+    """Write a full save file atomically and drop any journal"""
+    if binary:
+        _replace_save_file(file_path, _encode_binary(character))
+    else:
+        _replace_save_file(file_path, _format_text_save(character).encode())
+
+    journal_path = _journal_path(file_path)
+    try:
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
     except Exception as e:
         raise SaveFileCorruptedError(f"Failed to save character: {e}")
 
-    return True
-# ==========================
-def load_character(character_name, save_directory="data/save_games"):
-    file_path = os.path.join(save_directory, f"{character_name}.txt")
+    key = os.path.abspath(file_path)
+    with _journal_lock:
+        if journal:
+            _journal_state[key] = {"saved": _saved_fields(character), "entries": 0,
+                                   "binary": binary}
+        else:
+            _journal_state.pop(key, None)
 
-    if not os.path.exists(file_path):
-        raise CharacterNotFoundError(f"Save file '{file_path}' not found.")
 
+def _replace_save_file(file_path, data):
+    """Write data to a temp file of its own, then swap it into place"""
+    temp_path = None
     try:
-        with open(file_path, "r") as f:
-            lines = f.readlines()
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".",
+                                         prefix=os.path.basename(file_path) + ".",
+                                         suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
     except Exception as e:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise SaveFileCorruptedError(f"Failed to save character: {e}")
+
+
+def _format_text_save(character):
+    """Render the KEY: VALUE text save format"""
+    inventory_csv = ",".join(character["inventory"])
+    active_csv = ",".join(character["active_quests"])
+    completed_csv = ",".join(character["completed_quests"])
+
+    text = (
+        f"NAME: {character['name']}\n"
+        f"CLASS: {character['class']}\n"
+        f"LEVEL: {character['level']}\n"
+        f"HEALTH: {character['health']}\n"
+        f"MAX_HEALTH: {character['max_health']}\n"
+        f"STRENGTH: {character['strength']}\n"
+        f"MAGIC: {character['magic']}\n"
+        f"EXPERIENCE: {character['experience']}\n"
+        f"GOLD: {character['gold']}\n"
+        f"INVENTORY: {inventory_csv}\n"
+        f"ACTIVE_QUESTS: {active_csv}\n"
+        f"COMPLETED_QUESTS: {completed_csv}\n"
+    )
+    return text
+
+
+def _append_journal(character, file_path, binary=False):
+    """Append the fields changed since the last save; compact when too large"""
+    key = os.path.abspath(file_path)
+    with _journal_lock:
+        state = _journal_state.get(key)
+        if state is None:
+            saved, entries = _read_save_file(file_path)
+            state = {"saved": _saved_fields(saved), "entries": entries, "binary": binary}
+            _journal_state[key] = state
+
+        changes = {}
+        for field in SAVE_FIELDS:
+            if character[field] != state["saved"].get(field):
+                changes[field] = list(character[field]) if field in LIST_FIELDS else character[field]
+        if not changes:
+            return
+
+        try:
+            with open(_journal_path(file_path), "ab+") as f:
+                _trim_torn_entry(f)
+                f.write(json.dumps(changes, separators=(",", ":")).encode() + b"\n")
+                journal_bytes = f.tell()
+        except Exception as e:
+            raise SaveFileCorruptedError(f"Failed to save character: {e}")
+
+        state["saved"].update(changes)
+        state["entries"] += 1
+        if state["entries"] >= JOURNAL_MAX_ENTRIES or journal_bytes >= JOURNAL_MAX_BYTES:
+            _write_snapshot(character, file_path, journal=True, binary=state["binary"])
+
+
+def _trim_torn_entry(f):
+    """Cut a journal opened in ab+ mode back to its last complete line"""
+    size = f.seek(0, os.SEEK_END)
+    if size == 0:
+        return
+    f.seek(size - 1)
+    if f.read(1) == b"\n":
+        return
+    f.seek(0)
+    f.truncate(f.read().rfind(b"\n") + 1)
+
+
+def save_character(character, save_directory="data/save_games", journal=False, storage=None,
+                   binary=False):
+    """
+    Save a character to <save_directory>/<name>.txt
+
+    If a storage backend is given (or installed with set_storage_backend),
+    the character is saved there instead and save_directory/journal are
+    ignored.
+
+    With journal=True, an existing save is not rewritten: only the fields
+    that changed since the last save are appended to <name>.journal, and the
+    journal is compacted into a full snapshot after JOURNAL_MAX_ENTRIES
+    entries or JOURNAL_MAX_BYTES bytes.
+
+    With binary=True, snapshots use the compact binary format instead of
+    KEY: VALUE text (same file name; load_character detects the format).
+
+    When the character cache is enabled (enable_character_cache) and no
+    storage is given, saving a resident character only marks it dirty; it
+    is written when evicted or on flush_character_cache().
+
+    Returns: True
+    Raises: SaveFileCorruptedError if the save cannot be written
+    """
+    if storage is None and _character_cache is not None:
+        return _character_cache.put(character, save_directory, journal, binary)
+    return _save_uncached(character, save_directory, journal, storage, binary)
+
+
+def _save_uncached(character, save_directory, journal=False, storage=None, binary=False):
+    backend = storage or _storage_backend
+    if backend is not None:
+        return backend.save_character(character)
+    return _save_character_file(character, save_directory, journal, binary)
+
+
+_save_locks = weakref.WeakValueDictionary()  # (abs directory, name) -> Lock
+_save_locks_guard = threading.Lock()
+
+
+def _save_lock(save_directory, character_name):
+    """Lock that runs file writes for one character one at a time"""
+    key = (os.path.abspath(save_directory), character_name)
+    with _save_locks_guard:
+        lock = _save_locks.get(key)
+        if lock is None:
+            lock = _save_locks[key] = threading.Lock()
+        return lock
+
+
+def _save_character_file(character, save_directory, journal=False, binary=False):
+    os.makedirs(save_directory, exist_ok=True)
+
+    with _save_lock(save_directory, character["name"]):
+        file_path = _prepare_save_path(save_directory, character["name"])
+
+        if journal and os.path.exists(file_path):
+            _append_journal(character, file_path, binary)
+        else:
+            _write_snapshot(character, file_path, journal, binary)
+
+        _manifest_update(save_directory, _character_summary(character, time.time()))
+    return True
+# ==========================
+def _decode_save(data):
+    """Decode save file bytes in either the binary or the text format"""
+    if data.startswith(BINARY_MAGIC):
+        return _decode_binary(data)
+
+    try:
+        lines = data.decode().splitlines()
+    except UnicodeDecodeError as e:
         raise SaveFileCorruptedError(f"Cannot read save file: {e}")
 
-    character = {}
+    character = Character()
     for line in lines:
         if ":" not in line:
             continue
@@ -101,44 +469,739 @@ def load_character(character_name, save_directory="data/save_games"):
         key_name, key_value = key_name.strip(), key_value.strip()
         key_lower = key_name.lower()
 
-        if key_lower in ["level","health","max_health","strength","magic","experience","gold"]:
+        if key_lower in INT_FIELDS:
             try:
                 character[key_lower] = int(key_value)
             except:
                 raise InvalidSaveDataError(f"{key_name} must be an integer")
-        elif key_lower in ["inventory","active_quests","completed_quests"]:
-            character[key_lower] = [item.strip() for item in key_value.split(",")] if key_value else []
+        elif key_lower in LIST_FIELDS:
+            # Interned so resident characters share their item and quest ids
+            character[key_lower] = [sys.intern(item.strip()) for item in key_value.split(",")] if key_value else []
         else:
             character[key_lower] = key_value
+    return character
 
+
+def _read_save_file(file_path):
+    """
+    Read a snapshot and replay its journal, if any
+
+    Returns: (Character, number of journal entries replayed)
+    """
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        raise SaveFileCorruptedError(f"Cannot read save file: {e}")
+
+    character = _decode_save(data)
+
+    entries = 0
+    journal_path = _journal_path(file_path)
+    if os.path.exists(journal_path):
+        try:
+            with open(journal_path, "r") as f:
+                journal_lines = f.readlines()
+        except Exception as e:
+            raise SaveFileCorruptedError(f"Cannot read save journal: {e}")
+        if journal_lines and not journal_lines[-1].endswith("\n"):
+            # Torn final append; earlier entries are intact and the next
+            # journaled save trims it
+            journal_lines.pop()
+        for line in journal_lines:
+            try:
+                changes = json.loads(line)
+            except ValueError:
+                raise SaveFileCorruptedError(f"Corrupted journal entry in '{journal_path}'")
+            character.update(changes)
+            entries += 1
+
+    return character, entries
+
+
+def load_character(character_name, save_directory="data/save_games", storage=None):
+    if storage is None and _character_cache is not None:
+        return _character_cache.get(character_name, save_directory)
+    return _load_uncached(character_name, save_directory, storage)
+
+
+def _load_uncached(character_name, save_directory, storage=None):
+    backend = storage or _storage_backend
+    if backend is not None:
+        return backend.load_character(character_name)
+    return _load_character_file(character_name, save_directory)
+
+
+def _load_character_file(character_name, save_directory):
+    file_path = _find_save_path(save_directory, character_name)
+
+    if file_path is None:
+        missing_path = _flat_save_path(save_directory, character_name)
+        raise CharacterNotFoundError(f"Save file '{missing_path}' not found.")
+
+    character, _ = _read_save_file(file_path)
     return character
 
 # ==========================
-def list_saved_characters(save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        return []
-    return [f[:-4] for f in os.listdir(save_directory) if f.endswith(".txt")]
+def list_saved_characters(save_directory="data/save_games", storage=None):
+    backend = storage or _storage_backend
+    if backend is not None:
+        return backend.list_saved_characters()
+    return _list_character_files(save_directory)
+
+
+def iter_saved_characters(save_directory="data/save_games", storage=None):
+    """
+    Yield saved character names one at a time
+
+    Text saves are streamed with os.scandir, flat and sharded layouts alike,
+    so listing a very large save directory never holds every name in memory.
+    Names come in directory order, not sorted.
+    """
+    backend = storage or _storage_backend
+    if backend is not None:
+        return iter(backend.list_saved_characters())
+    return _iter_character_files(save_directory)
+
+
+def _list_character_files(save_directory):
+    return list(_iter_character_files(save_directory))
+
+
+def _iter_character_files(save_directory):
+    try:
+        entries = os.scandir(save_directory)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".txt"):
+                if entry.is_file():
+                    yield entry.name[:-4]
+            elif len(entry.name) == SHARD_WIDTH and entry.is_dir():
+                yield from _iter_shard_files(entry.path, levels=SHARD_LEVELS - 1)
+
+
+def _iter_shard_files(shard_directory, levels):
+    with os.scandir(shard_directory) as entries:
+        for entry in entries:
+            if levels:
+                if len(entry.name) == SHARD_WIDTH and entry.is_dir():
+                    yield from _iter_shard_files(entry.path, levels - 1)
+            elif entry.name.endswith(".txt") and entry.is_file():
+                yield entry.name[:-4]
 
 # ==========================
-def delete_character(character_name, save_directory="data/save_games"):
-    file_path = os.path.join(save_directory, f"{character_name}.txt")
+def delete_character(character_name, save_directory="data/save_games", storage=None):
+    if _character_cache is not None:
+        _character_cache.discard(character_name, save_directory)
+    backend = storage or _storage_backend
+    if backend is not None:
+        return backend.delete_character(character_name)
+    return _delete_character_file(character_name, save_directory)
+
+
+def _delete_character_file(character_name, save_directory):
+    with _save_lock(save_directory, character_name):
+        file_path = _find_save_path(save_directory, character_name)
+        if file_path is None:
+            missing_path = _flat_save_path(save_directory, character_name)
+            raise CharacterNotFoundError(f"Save file '{missing_path}' not found.")
+        os.remove(file_path)
+        journal_path = _journal_path(file_path)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        with _journal_lock:
+            _journal_state.pop(os.path.abspath(file_path), None)
+        _manifest_update(save_directory, {"name": character_name, "deleted": True})
+    return True
+
+# ==========================
+# SAVE LAYOUT
+# ==========================
+# A save directory starts flat (<save_directory>/<name>.txt). Once it holds
+# the SHARD_MARKER file, saves live two hash-prefix levels down instead
+# (<save_directory>/ab/cd/<name>.txt), so no single directory grows to
+# millions of entries. Lookups try the sharded path and then the flat one,
+# which keeps a directory usable while migrate_to_sharded_layout runs; any
+# save that touches a flat file moves it into its shard. The manifest stays
+# at the top of the save directory in both layouts.
+
+SHARD_MARKER = ".sharded"
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2  # hex characters per level
+_sharded_directories = set()  # abs save directories known to be sharded
+
+
+def _is_sharded(save_directory):
+    key = os.path.abspath(save_directory)
+    if key in _sharded_directories:
+        return True
+    if os.path.exists(os.path.join(save_directory, SHARD_MARKER)):
+        _sharded_directories.add(key)
+        return True
+    return False
+
+
+def _flat_save_path(save_directory, character_name):
+    return os.path.join(save_directory, f"{character_name}.txt")
+
+
+def _sharded_save_path(save_directory, character_name):
+    digest = hashlib.blake2b(character_name.encode(),
+                             digest_size=SHARD_LEVELS * SHARD_WIDTH // 2).hexdigest()
+    prefixes = [digest[i:i + SHARD_WIDTH] for i in range(0, len(digest), SHARD_WIDTH)]
+    return os.path.join(save_directory, *prefixes, f"{character_name}.txt")
+
+
+def _find_save_path(save_directory, character_name):
+    """Path of the existing save for a character, or None"""
+    if _is_sharded(save_directory):
+        file_path = _sharded_save_path(save_directory, character_name)
+        if os.path.exists(file_path):
+            return file_path
+    file_path = _flat_save_path(save_directory, character_name)
+    return file_path if os.path.exists(file_path) else None
+
+
+def _prepare_save_path(save_directory, character_name):
+    """Path to write a save to, moving a leftover flat save into its shard"""
+    flat_path = _flat_save_path(save_directory, character_name)
+    if not _is_sharded(save_directory):
+        return flat_path
+
+    file_path = _sharded_save_path(save_directory, character_name)
     if not os.path.exists(file_path):
-        raise CharacterNotFoundError(f"Save file '{file_path}' not found.")
+        if os.path.exists(flat_path):
+            try:
+                _move_save(flat_path, file_path)
+            except FileNotFoundError:
+                pass  # A concurrent migration moved it first
+        else:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    return file_path
+
+
+def _move_save(source_path, target_path):
+    """Move a save file and its journal, keeping the journal state"""
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    os.replace(source_path, target_path)
+    source_journal = _journal_path(source_path)
+    if os.path.exists(source_journal):
+        os.replace(source_journal, _journal_path(target_path))
+    with _journal_lock:
+        state = _journal_state.pop(os.path.abspath(source_path), None)
+        if state is not None:
+            _journal_state[os.path.abspath(target_path)] = state
+
+
+def migrate_to_sharded_layout(save_directory="data/save_games"):
+    """
+    Move a flat save directory to the hash-sharded layout
+
+    The marker file is written before anything moves, so the game can keep
+    saving and loading while the migration runs: new saves go straight to
+    their shard and loads find each character at either path. Each move
+    holds that character's save lock, so it never interleaves with a save.
+    Safe to run again after an interruption; a character left with a save
+    in both layouts keeps whichever copy was written last.
+
+    Returns: Number of save files moved
+    """
+    os.makedirs(save_directory, exist_ok=True)
+    marker_path = os.path.join(save_directory, SHARD_MARKER)
+    if not os.path.exists(marker_path):
+        with open(marker_path, "w"):
+            pass
+    _sharded_directories.add(os.path.abspath(save_directory))
+
+    moved = 0
+    with os.scandir(save_directory) as entries:
+        flat_saves = [entry.name[:-4] for entry in entries
+                      if entry.name.endswith(".txt") and entry.is_file()]
+    for name in flat_saves:
+        flat_path = _flat_save_path(save_directory, name)
+        file_path = _sharded_save_path(save_directory, name)
+        # Each move waits for any save of that character in progress
+        with _save_lock(save_directory, name):
+            try:
+                if os.path.exists(file_path):
+                    # Left behind by an interrupted run; keep the newer copy
+                    if _save_mtime(flat_path) <= _save_mtime(file_path):
+                        _discard_save(flat_path)
+                        continue
+                    _discard_save(file_path)
+                _move_save(flat_path, file_path)
+                moved += 1
+            except FileNotFoundError:
+                continue  # A concurrent save already moved it
+    return moved
+
+
+def _save_mtime(file_path):
+    """Last time a save or its journal was written"""
+    journal_path = _journal_path(file_path)
+    if os.path.exists(journal_path):
+        return max(os.path.getmtime(file_path), os.path.getmtime(journal_path))
+    return os.path.getmtime(file_path)
+
+
+def _discard_save(file_path):
+    """Remove a save file and its journal"""
     os.remove(file_path)
+    if os.path.exists(_journal_path(file_path)):
+        os.remove(_journal_path(file_path))
+    with _journal_lock:
+        _journal_state.pop(os.path.abspath(file_path), None)
+
+# ==========================
+# SAVE MANIFEST
+# ==========================
+# <save_directory>/manifest.jsonl holds one JSON summary line per save or
+# deletion (name, class, level, gold, modified). Replaying it gives a
+# summary of every saved character without opening the save files; it is
+# rewritten compactly once it holds many superseded lines.
+
+MANIFEST_NAME = "manifest.jsonl"
+MANIFEST_MIN_COMPACT_LINES = 64
+_manifests = {}  # abs save directory -> {"entries": {name: summary}, "lines": count}
+_manifest_lock = threading.RLock()  # Saves may run on worker threads
+
+
+def _character_summary(character, modified):
+    return {
+        "name": character["name"],
+        "class": character["class"],
+        "level": character["level"],
+        "gold": character["gold"],
+        "modified": modified
+    }
+
+
+def _write_manifest(save_directory, entries):
+    manifest_path = os.path.join(save_directory, MANIFEST_NAME)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as f:
+        for summary in entries.values():
+            f.write(json.dumps(summary, separators=(",", ":")) + "\n")
+    os.replace(temp_path, manifest_path)
+
+
+def _load_manifest(save_directory):
+    """Return the cached manifest state, reading or rebuilding it if needed"""
+    key = os.path.abspath(save_directory)
+    state = _manifests.get(key)
+    if state is not None:
+        return state
+
+    entries = {}
+    lines = 0
+    try:
+        with open(os.path.join(save_directory, MANIFEST_NAME), "r") as f:
+            for line in f:
+                summary = json.loads(line)
+                if summary.get("deleted"):
+                    entries.pop(summary["name"], None)
+                else:
+                    entries[summary["name"]] = summary
+                lines += 1
+    except (OSError, ValueError, KeyError, AttributeError):
+        rebuild_manifest(save_directory)
+        return _manifests[key]
+
+    state = {"entries": entries, "lines": lines}
+    _manifests[key] = state
+    return state
+
+
+def _manifest_update(save_directory, summary):
+    """Record one save or deletion in the manifest"""
+    with _manifest_lock:
+        _manifest_apply(save_directory, summary)
+
+
+def _manifest_apply(save_directory, summary):
+    state = _load_manifest(save_directory)
+    if summary.get("deleted"):
+        state["entries"].pop(summary["name"], None)
+    else:
+        state["entries"][summary["name"]] = summary
+
+    try:
+        if state["lines"] >= max(MANIFEST_MIN_COMPACT_LINES, 2 * len(state["entries"])):
+            _write_manifest(save_directory, state["entries"])
+            state["lines"] = len(state["entries"])
+        else:
+            with open(os.path.join(save_directory, MANIFEST_NAME), "a") as f:
+                f.write(json.dumps(summary, separators=(",", ":")) + "\n")
+            state["lines"] += 1
+    except OSError:
+        # The manifest is only an index; rebuild_manifest can repair it
+        _manifests.pop(os.path.abspath(save_directory), None)
+
+
+def rebuild_manifest(save_directory="data/save_games"):
+    """
+    Rebuild the manifest by opening every save file in the directory
+
+    Use this to repair the manifest after saves were copied in or removed
+    by hand.
+
+    Returns: Number of characters in the rebuilt manifest
+    """
+    entries = {}
+    for name in _iter_character_files(save_directory):
+        file_path = _find_save_path(save_directory, name)
+        if file_path is None:
+            continue
+        try:
+            character, _ = _read_save_file(file_path)
+        except (SaveFileCorruptedError, InvalidSaveDataError):
+            continue
+        modified = os.path.getmtime(file_path)
+        journal_path = _journal_path(file_path)
+        if os.path.exists(journal_path):
+            modified = max(modified, os.path.getmtime(journal_path))
+        try:
+            entries[name] = _character_summary(character, modified)
+        except KeyError:
+            continue
+
+    with _manifest_lock:
+        if os.path.isdir(save_directory):
+            _write_manifest(save_directory, entries)
+        _manifests[os.path.abspath(save_directory)] = {"entries": entries, "lines": len(entries)}
+    return len(entries)
+
+
+def query_saved_characters(save_directory="data/save_games", sort_by="name",
+                           descending=False, character_class=None,
+                           min_level=None, max_level=None, offset=0, limit=None,
+                           storage=None):
+    """
+    Page, sort and filter saved characters without opening their save files
+
+    Args:
+        sort_by: "name", "class", "level", "gold" or "modified"
+        character_class: Only include this class (None = any)
+        min_level / max_level: Inclusive level bounds (None = unbounded)
+        offset / limit: Page window over the sorted results
+
+    Returns: List of summary dictionaries with name, class, level, gold
+             and modified (seconds since the epoch)
+    """
+    backend = storage or _storage_backend
+    if backend is not None:
+        return backend.query_saved_characters(
+            sort_by, descending, character_class, min_level, max_level, offset, limit
+        )
+
+    with _manifest_lock:
+        entries = list(_load_manifest(save_directory)["entries"].values())
+    summaries = [
+        summary for summary in entries
+        if (character_class is None or summary["class"] == character_class)
+        and (min_level is None or summary["level"] >= min_level)
+        and (max_level is None or summary["level"] <= max_level)
+    ]
+    summaries.sort(key=lambda summary: summary[sort_by], reverse=descending)
+    end = None if limit is None else offset + limit
+    return summaries[offset:end]
+
+# ==========================
+# STORAGE BACKENDS
+# ==========================
+# A storage backend is any object with save_character(character),
+# load_character(name), list_saved_characters() and delete_character(name).
+# TextFileStorage is the one-text-file-per-character format above;
+# sqlite_storage.SQLiteStorage keeps every character in one database.
+
+_storage_backend = None
+
+
+class TextFileStorage:
+    """Storage backend for the one-<name>.txt-per-character save format"""
+
+    def __init__(self, save_directory="data/save_games", journal=False, binary=False):
+        self.save_directory = save_directory
+        self.journal = journal
+        self.binary = binary
+
+    def save_character(self, character):
+        return _save_character_file(character, self.save_directory, self.journal, self.binary)
+
+    def save_many(self, characters):
+        for character in characters:
+            self.save_character(character)
+        return True
+
+    def load_character(self, character_name):
+        return _load_character_file(character_name, self.save_directory)
+
+    def list_saved_characters(self):
+        return _list_character_files(self.save_directory)
+
+    def delete_character(self, character_name):
+        return _delete_character_file(character_name, self.save_directory)
+
+
+def set_storage_backend(backend):
+    """
+    Route save/load/list/delete through a storage backend
+
+    Pass None to go back to the default text files. Returns the previous
+    backend.
+    """
+    global _storage_backend
+    previous = _storage_backend
+    _storage_backend = backend
+    return previous
+
+
+def get_storage_backend():
+    """Return the installed storage backend, or None for text files"""
+    return _storage_backend
+
+# ==========================
+class SaveQueue:
+    """
+    Write-behind save queue
+
+    enqueue() snapshots a character and returns immediately; a background
+    worker writes queued saves in batches through save_character. Saving
+    the same character again before it is written replaces the queued
+    snapshot, so only the latest state hits the disk. The worker is a
+    daemon thread, so register close() with atexit (as main.py does) or
+    call it before shutdown, or queued saves are lost.
+    """
+
+    def __init__(self, save_directory="data/save_games", batch_size=64, journal=False,
+                 storage=None, binary=False):
+        self.save_directory = save_directory
+        self.batch_size = batch_size
+        self.journal = journal
+        self.storage = storage
+        self.binary = binary
+        self._pending = {}
+        self._in_flight = 0
+        self._errors = []
+        self._closed = False
+        self._worker = None
+        self._condition = threading.Condition()
+
+    def enqueue(self, character):
+        """Queue a snapshot of the character for saving"""
+        snapshot = _saved_fields(character)
+
+        with self._condition:
+            if self._closed:
+                raise SaveFileCorruptedError("Save queue is closed")
+            self._pending[snapshot["name"]] = snapshot
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+        return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending and self._closed:
+                    return
+                names = list(self._pending)[:self.batch_size]
+                batch = [self._pending.pop(name) for name in names]
+                self._in_flight = len(batch)
+
+            errors = []
+            backend = self.storage or _storage_backend
+            if backend is not None and hasattr(backend, "save_many"):
+                # One batched write (e.g. a single database transaction)
+                try:
+                    backend.save_many(batch)
+                except Exception as e:
+                    errors.append(e)
+            else:
+                for snapshot in batch:
+                    try:
+                        _save_uncached(snapshot, self.save_directory, self.journal,
+                                       self.storage, self.binary)
+                    except Exception as e:
+                        errors.append(e)
+
+            with self._condition:
+                self._in_flight = 0
+                self._errors.extend(errors)
+                self._condition.notify_all()
+
+    def pending_count(self):
+        """Number of saves queued or being written"""
+        with self._condition:
+            return len(self._pending) + self._in_flight
+
+    def flush(self):
+        """
+        Block until every queued save has been written
+
+        Returns: True if all saves succeeded
+        Raises: SaveFileCorruptedError for the first save that failed
+        """
+        with self._condition:
+            while self._pending or self._in_flight:
+                self._condition.wait()
+            errors, self._errors = self._errors, []
+        if errors:
+            raise SaveFileCorruptedError(f"{len(errors)} queued save(s) failed: {errors[0]}")
+        return True
+
+    def close(self):
+        """Flush outstanding saves and stop the worker"""
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._worker is not None:
+                self._worker.join()
+
+# ==========================
+# CHARACTER CACHE
+# ==========================
+
+_character_cache = None
+
+
+class CharacterCache:
+    """
+    Bounded LRU cache of loaded characters with write-back saving
+
+    get() returns the resident character object on a hit and loads it on a
+    miss. put() marks a resident character dirty instead of writing it; the
+    first save of a character that is not resident is written through so it
+    shows up in listings right away. Dirty characters are written through
+    the normal save path when they are evicted or on flush().
+
+    A dirty character is only evicted once its write-back succeeds. If the
+    write-back fails, the load/save call that triggered the eviction raises
+    SaveFileCorruptedError and the character stays cached and dirty, so the
+    next eviction or flush() retries it.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self._entries = OrderedDict()  # (directory, name) -> entry dict
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(character_name, save_directory):
+        return (os.path.abspath(save_directory), character_name)
+
+    def get(self, character_name, save_directory="data/save_games"):
+        key = self._key(character_name, save_directory)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry["character"]
+            self.misses += 1
+
+        character = _load_uncached(character_name, save_directory)
+        with self._lock:
+            entry = self._entries.setdefault(key, {
+                "character": character, "dirty": False, "directory": save_directory,
+                "journal": False, "binary": False
+            })
+            self._evict()
+            return entry["character"]
+
+    def put(self, character, save_directory="data/save_games", journal=False, binary=False):
+        key = self._key(character["name"], save_directory)
+        with self._lock:
+            resident = key in self._entries
+            entry = {
+                "character": character, "dirty": True, "directory": save_directory,
+                "journal": journal, "binary": binary
+            }
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+        if not resident:
+            _save_uncached(character, save_directory, journal, binary=binary)
+            entry["dirty"] = False
+        with self._lock:
+            self._evict()
+        return True
+
+    def discard(self, character_name, save_directory="data/save_games"):
+        """Drop a character without writing it back"""
+        with self._lock:
+            self._entries.pop(self._key(character_name, save_directory), None)
+
+    def _evict(self):
+        while len(self._entries) > self.capacity:
+            key, entry = next(iter(self._entries.items()))
+            if entry["dirty"]:
+                self._write_back(entry)  # Raises with the entry still resident
+            del self._entries[key]
+            self.evictions += 1
+
+    def _write_back(self, entry):
+        _save_uncached(entry["character"], entry["directory"], entry["journal"],
+                       binary=entry["binary"])
+        entry["dirty"] = False
+        self.writebacks += 1
+
+    def flush(self):
+        """Write every dirty character back; they stay resident"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry["dirty"]:
+                    self._write_back(entry)
+        return True
+
+    def stats(self):
+        with self._lock:
+            dirty = sum(1 for entry in self._entries.values() if entry["dirty"])
+            return {
+                "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "writebacks": self.writebacks,
+                "size": len(self._entries), "dirty": dirty, "capacity": self.capacity
+            }
+
+
+def enable_character_cache(capacity=256):
+    """Route load_character/save_character through an LRU CharacterCache"""
+    global _character_cache
+    if _character_cache is None:
+        _character_cache = CharacterCache(capacity)
+    return _character_cache
+
+
+def flush_character_cache():
+    """Write back dirty cached characters (no-op when the cache is off)"""
+    if _character_cache is not None:
+        _character_cache.flush()
     return True
 
+
+def disable_character_cache():
+    """Flush and remove the character cache"""
+    global _character_cache
+    cache, _character_cache = _character_cache, None
+    if cache is not None:
+        cache.flush()
+
 # ==========================
 def gain_experience(character, xp_amount):
     if character['health'] <= 0:
         raise CharacterDeadError("Character has died")
-    character['experience'] += xp_amount
-    while character['experience'] >= character['level'] * 100:
-        character['experience'] -= character['level'] * 100
-        character['level'] += 1
-        character['max_health'] += 10
-        character['strength'] += 2
-        character['magic'] += 2
-        character['health'] = character['max_health']
+    apply_experience(character, xp_amount)
     return True
 
 # ==========================
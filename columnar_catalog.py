@@ -0,0 +1,121 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Columnar Catalog Module
+
+This module stores the numeric fields of a quest or item catalog in
+contiguous arrays so level-range, affordability and reward-sum queries can
+run as vectorized masks instead of Python loops over every record.
+
+NumPy is used when it is installed; otherwise the columns fall back to the
+standard library's array module.
+"""
+
+from array import array
+from collections.abc import Mapping
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+QUEST_COLUMNS = ("required_level", "reward_xp", "reward_gold")
+ITEM_COLUMNS = ("cost",)
+
+
+class ColumnarCatalog(Mapping):
+    """
+    Read-only {record_id: record} mapping with array-backed numeric columns
+
+    Behaves like the catalog dictionary it was built from, so it can be
+    passed anywhere a quest or item dictionary is expected. The columns are
+    a snapshot: rebuild the catalog after the underlying records change.
+    """
+
+    def __init__(self, records, columns):
+        """
+        Args:
+            records: Dictionary of {record_id: record}
+            columns: Names of the integer fields to store as columns
+        """
+        self._records = dict(records)
+        self._ids = list(self._records)
+        self._rows = {record_id: row for row, record_id in enumerate(self._ids)}
+        self.columns = {}
+        for column in columns:
+            values = [int(record.get(column, 0)) for record in self._records.values()]
+            if np is not None:
+                self.columns[column] = np.array(values, dtype=np.int64)
+            else:
+                self.columns[column] = array("q", values)
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+    def __getitem__(self, record_id):
+        return self._records[record_id]
+
+    def __contains__(self, record_id):
+        return record_id in self._records
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    # ------------------------------------------------------------------
+    # Column queries
+    # ------------------------------------------------------------------
+    def ids_between(self, column, low=None, high=None):
+        """
+        Get ids whose column value is within [low, high] (None = unbounded)
+
+        Returns: List of record ids in catalog order
+        """
+        values = self.columns[column]
+        if np is not None:
+            mask = np.ones(len(values), dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            return [self._ids[row] for row in np.flatnonzero(mask)]
+
+        if low is None and high is None:
+            return list(self._ids)
+        if low is None:
+            mask = (value <= high for value in values)
+        elif high is None:
+            mask = (value >= low for value in values)
+        else:
+            mask = (low <= value <= high for value in values)
+        return list(compress(self._ids, mask))
+
+    def select_between(self, column, low=None, high=None):
+        """Get records whose column value is within [low, high]"""
+        return [self._records[record_id] for record_id in self.ids_between(column, low, high)]
+
+    def sum_column(self, column, record_ids=None):
+        """
+        Sum a column over the given ids (all records if record_ids is None)
+
+        Ids that are not in the catalog are ignored.
+        """
+        values = self.columns[column]
+        if record_ids is None:
+            return int(sum(values))
+        rows = [self._rows[rid] for rid in record_ids if rid in self._rows]
+        if np is not None:
+            return int(values[rows].sum())
+        return sum(values[row] for row in rows)
+
+
+def columnar_quests(quest_data_dict):
+    """Build a ColumnarCatalog over a quest dictionary"""
+    return ColumnarCatalog(quest_data_dict, QUEST_COLUMNS)
+
+
+def columnar_items(item_data_dict):
+    """Build a ColumnarCatalog over an item dictionary"""
+    return ColumnarCatalog(item_data_dict, ITEM_COLUMNS)
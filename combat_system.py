@@ -9,124 +9,342 @@ AI Usage: [Document any AI assistance used]
 Handles combat mechanics
 """
 
+import os
+import sys
+import random
+import struct
+from array import array
+from collections.abc import Mapping
+
 from custom_exceptions import (
+    InvalidDataFormatError,
     InvalidTargetError,
     CombatNotActiveError,
     CharacterDeadError,
     AbilityOnCooldownError
 )
+from game_data import load_enemies
 
 # ============================================================================
 # ENEMY DEFINITIONS
 # ============================================================================
+ENEMY_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "enemies.txt")
+_enemy_registry = None
+
+
+class EnemyRegistry(Mapping):
+    """
+    Enemy prototypes by enemy id, plus a precomputed level -> enemy table
+
+    Every enemy is built once as a ready-to-fight enemy dictionary;
+    spawning copies that prototype instead of rebuilding its fields. Looking
+    up the enemy for a level is a single list index. Iterating gives the
+    enemy ids in file order; the prototypes themselves must not be modified.
+    """
+
+    def __init__(self, enemies):
+        """
+        Args:
+            enemies: Dictionary of {enemy_id: record} from game_data.load_enemies
+        Raises: InvalidDataFormatError if a level range is empty, starts
+                below 1 or overlaps another enemy's range
+        """
+        self._prototypes = {}
+        ranges = []
+        for enemy_id, record in enemies.items():
+            min_level, max_level = record["min_level"], record["max_level"]
+            if min_level < 1 or (max_level is not None and max_level < min_level):
+                raise InvalidDataFormatError(f"Invalid level range for enemy '{enemy_id}'")
+            prototype = {
+                "name": record["name"],
+                "type": record["type"],
+                "health": record["health"],
+                "max_health": record["health"],
+                "strength": record["strength"],
+                "magic": record["magic"],
+                "xp_reward": record["xp_reward"],
+                "gold_reward": record["gold_reward"]
+            }
+            self._prototypes[enemy_id.lower()] = prototype
+            ranges.append((enemy_id, min_level, max_level, prototype))
+
+        # Levels above the table use the enemy with no MAX_LEVEL, if any
+        top = max((max_level or min_level for _, min_level, max_level, _ in ranges), default=0)
+        self._by_level = [None] * (top + 1)
+        self._open_ended = None
+        for enemy_id, min_level, max_level, prototype in ranges:
+            if max_level is None:
+                self._open_ended = prototype
+                max_level = top
+            for level in range(min_level, max_level + 1):
+                if self._by_level[level] is not None:
+                    raise InvalidDataFormatError(
+                        f"Enemy '{enemy_id}' overlaps another enemy at level {level}"
+                    )
+                self._by_level[level] = prototype
+
+    def __getitem__(self, enemy_id):
+        return self._prototypes[enemy_id]
+
+    def __iter__(self):
+        return iter(self._prototypes)
+
+    def __len__(self):
+        return len(self._prototypes)
+
+    def spawn(self, enemy_type):
+        """
+        Create a fresh enemy by copying its prototype
+
+        Returns: Enemy dictionary
+        Raises: InvalidTargetError if enemy_type is not in the registry
+        """
+        prototype = self._prototypes.get(enemy_type.lower())
+        if prototype is None:
+            raise InvalidTargetError(f"Unknown enemy: {enemy_type.lower()}")
+        return prototype.copy()
+
+    def spawn_for_level(self, character_level):
+        """Create the enemy for a character level, or None if no enemy fits"""
+        if 0 < character_level < len(self._by_level):
+            prototype = self._by_level[character_level]
+        elif character_level >= len(self._by_level):
+            prototype = self._open_ended
+        else:
+            prototype = None
+        return None if prototype is None else prototype.copy()
+
+
+def load_enemy_registry(filename=ENEMY_DATA_FILE):
+    """
+    Load an enemy data file and make it the registry create_enemy uses
+
+    Returns: The new EnemyRegistry
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    global _enemy_registry
+    _enemy_registry = EnemyRegistry(load_enemies(filename))
+    return _enemy_registry
+
+
+def get_enemy_registry():
+    """Return the enemy registry, loading data/enemies.txt on first use"""
+    registry = _enemy_registry
+    if registry is None:
+        registry = load_enemy_registry()
+    return registry
+
+
 def create_enemy(enemy_type):
     """
     Create an enemy based on type
 
-    Example enemy types and stats:
-    - goblin: health=50, strength=8, magic=2, xp_reward=25, gold_reward=10
-    - orc: health=80, strength=12, magic=5, xp_reward=50, gold_reward=25
-    - dragon: health=200, strength=25, magic=15, xp_reward=200, gold_reward=100
+    Enemy types and their stats come from data/enemies.txt (see
+    game_data.load_enemies); the file is read once, on first use.
 
     Returns: Enemy dictionary
     Raises: InvalidTargetError if enemy_type not recognized
     """
-    enemies = {
-        "goblin": {
-            "name": "Goblin",
-            "type": "Goblin",
-            "health": 30,
-            "max_health": 30,
-            "strength": 5,
-            "magic": 0,
-            "xp_reward": 10,
-            "gold_reward": 5
-        },
-        "orc": {
-            "name": "Orc",
-            "type": "Orc",
-            "health": 50,
-            "max_health": 50,
-            "strength": 12,
-            "magic": 2,
-            "xp_reward": 20,
-            "gold_reward": 12
-        },
-        "dragon": {
-            "name": "Dragon",
-            "type": "Dragon",
-            "health": 200,
-            "max_health": 200,
-            "strength": 25,
-            "magic": 15,
-            "xp_reward": 200,
-            "gold_reward": 100
-        }
-    }
-
-    enemy_type = enemy_type.lower()  # normalize input
-
-    if enemy_type not in enemies:
-        raise InvalidTargetError(f"Unknown enemy: {enemy_type}")
-
-    e = enemies[enemy_type]
-    return {
-        "name": e["name"],
-        "type": e["type"],
-        "health": e["health"],
-        "max_health": e["max_health"],
-        "strength": e["strength"],
-        "magic": e["magic"],
-        "xp_reward": e["xp_reward"],
-        "gold_reward": e["gold_reward"]
-    }
+    return get_enemy_registry().spawn(enemy_type)
 
 
 def get_random_enemy_for_level(character_level):
     """
     Get an appropriate enemy for character's level
 
+    The level ranges come from MIN_LEVEL/MAX_LEVEL in data/enemies.txt:
     Level 1-2: Goblins
     Level 3-5: Orcs
     Level 6+: Dragons
 
-    Returns: Enemy dictionary
+    Returns: Enemy dictionary, or None if no enemy covers the level
     """
-    if character_level in range(1, 3):
-        return create_enemy("goblin")
-    elif character_level in range(3, 6):
-        return create_enemy("orc")
-    elif character_level >= 6:
-        return create_enemy("dragon")
+    return get_enemy_registry().spawn_for_level(character_level)
 
 
 # ============================================================================ 
 # COMBAT SYSTEM
 # ============================================================================ 
 
+# A player strategy is a callable strategy(battle) returning one of
+# PLAYER_ACTIONS; an enemy strategy returns one of ENEMY_ACTIONS. Strategies
+# that need randomness draw from battle.rng, which is seeded from the
+# battle's seed, so a seed plus the recorded moves replays a battle exactly.
+# Battles report what happens as events
+#   {"turn", "actor", "action", "damage", "player_health", "enemy_health"}
+# (health after the action) instead of printing, so they can run headless.
+
+PLAYER_ACTIONS = ("attack", "special", "run")
+ENEMY_ACTIONS = ("attack",)
+ACTORS = ("player", "enemy")
+DEFAULT_MAX_TURNS = 500
+
+
+class BattleLog:
+    """
+    Compact, array-backed record of a battle's events
+
+    Each event is six 32-bit integers (turn, actor, action, damage, player
+    health, enemy health) in one flat array, instead of a dictionary per
+    event, and to_bytes() packs the whole log with its seed for storage.
+    Indexing and iteration give back event dictionaries.
+    """
+
+    MAGIC = b"QCBL"
+    VERSION = 1
+    FIELDS = ("turn", "actor", "action", "damage", "player_health", "enemy_health")
+    _HEADER = struct.Struct("<4sBQ")
+    _ACTOR_CODES = {actor: code for code, actor in enumerate(ACTORS)}
+    _ACTION_CODES = {action: code for code, action in enumerate(PLAYER_ACTIONS)}
+
+    __slots__ = ("seed", "_data")
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self._data = array("i")
+
+    def record(self, turn, actor, action, damage, player_health, enemy_health):
+        """Add one event"""
+        self._data.extend((turn, self._ACTOR_CODES[actor], self._ACTION_CODES[action],
+                           damage, player_health, enemy_health))
+
+    def append(self, event):
+        """Add an event dictionary (so a log can also be used as an event_sink)"""
+        self.record(*(event[field] for field in self.FIELDS))
+
+    def __len__(self):
+        return len(self._data) // len(self.FIELDS)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("battle log index out of range")
+        start = index * len(self.FIELDS)
+        values = self._data[start:start + len(self.FIELDS)]
+        turn, actor, action, damage, player_health, enemy_health = values
+        return {
+            "turn": turn,
+            "actor": ACTORS[actor],
+            "action": PLAYER_ACTIONS[action],
+            "damage": damage,
+            "player_health": player_health,
+            "enemy_health": enemy_health
+        }
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, BattleLog):
+            return NotImplemented
+        return self.seed == other.seed and self._data == other._data
+
+    def player_actions(self):
+        """The player's moves in order, as fed back in by replay_battle"""
+        step = len(self.FIELDS)
+        return [PLAYER_ACTIONS[action]
+                for actor, action in zip(self._data[1::step], self._data[2::step])
+                if actor == 0]
+
+    def to_bytes(self):
+        """Pack the seed and events into little-endian bytes"""
+        data = self._data
+        if sys.byteorder != "little":
+            data = array("i", data)
+            data.byteswap()
+        return self._HEADER.pack(self.MAGIC, self.VERSION, self.seed) + data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """
+        Unpack a log written by to_bytes
+
+        Raises: ValueError if the bytes are not a battle log
+        """
+        header_size = cls._HEADER.size
+        record_size = len(cls.FIELDS) * array("i").itemsize
+        if len(payload) < header_size or (len(payload) - header_size) % record_size:
+            raise ValueError("Not a battle log: bad length")
+        magic, version, seed = cls._HEADER.unpack_from(payload, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a battle log: bad header")
+        log = cls(seed)
+        log._data.frombytes(payload[header_size:])
+        if sys.byteorder != "little":
+            log._data.byteswap()
+        return log
+
+
+def interactive_strategy(battle):
+    """Ask the player for a move on the terminal (the default strategy)"""
+    display_combat_stats(battle.character, battle.enemy)
+    moves = {"1": "attack", "2": "special", "3": "run"}
+    while True:
+        choice = input("Choose your move!:\n1: Basic Attack\n2: Special Ability\n3: Run Away\n")
+        if choice.strip() in moves:
+            return moves[choice.strip()]
+        print("Please enter 1, 2 or 3.")
+
+
+def always_attack(battle):
+    """Strategy that attacks every turn (the default enemy strategy)"""
+    return "attack"
+
+
 class SimpleBattle:
     """
     Simple turn-based combat system
 
-    Manages combat between character and enemy
+    Manages combat between character and enemy. Each turn the player acts
+    and then, if the battle is still on, the enemy does. Decisions come from
+    the player and enemy strategies, so a battle runs the same way at the
+    terminal and headless on a server.
     """
 
-    def __init__(self, character, enemy):
+    def __init__(self, character, enemy, player_strategy=None, enemy_strategy=None,
+                 event_sink=None, max_turns=DEFAULT_MAX_TURNS, seed=None):
         """
         Initialize battle with character and enemy
+
+        Args:
+            player_strategy: Callable(battle) -> "attack"|"special"|"run";
+                             defaults to interactive_strategy
+            enemy_strategy: Callable(battle) -> "attack"; defaults to always_attack
+            event_sink: Callable(event) receiving each event dictionary;
+                        when None, events are recorded in self.events, a BattleLog
+            max_turns: Turns after which the battle ends with no winner
+            seed: Seed for self.rng (0 <= seed < 2**64); a random one is
+                  drawn and kept in self.seed when None
         """
         self.character = character
         self.enemy = enemy
+        self.player_strategy = player_strategy or interactive_strategy
+        self.enemy_strategy = enemy_strategy or always_attack
+        self.event_sink = event_sink
+        self.max_turns = max_turns
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self._rng = None
+        self.events = BattleLog(self.seed)
         self.combat_active = True
         self.turn_counter = 0
         self.battle_result = None
 
+    @property
+    def rng(self):
+        """Random generator for strategies, seeded from self.seed on first use"""
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+
     def start_battle(self):
         """
-        Start the combat loop
+        Run the combat loop until someone wins, the player escapes or
+        max_turns is reached
 
         Returns: Dictionary with battle results:
-        {'winner': 'player'|'enemy', 'xp_gained': int, 'gold_gained': int}
+        {'winner': 'player'|'enemy'|'none', 'xp_gained': int, 'gold_gained': int}
         Raises: CharacterDeadError if character is already dead
         """
         from character_manager import is_character_dead
@@ -134,76 +352,103 @@ class SimpleBattle:
         if is_character_dead(self.character):
             raise CharacterDeadError("Character is already dead, cannot start battle.")
 
+        self.combat_active = True
+        self.battle_result = None
         self.turn_counter = 1
-        battle_results = {"winner": None, "xp_gained": 0, "gold_gained": 0}
-
-        # TODO: Implement actual battle loop
-        return battle_results
-
-    def player_turn(self):
+        while self.combat_active:
+            if self.turn_counter > self.max_turns:
+                self._end_battle("none")
+                break
+            self.player_turn()
+            if self.combat_active:
+                self.enemy_turn()
+            self.turn_counter += 1
+
+        return self.battle_result
+
+    def player_turn(self, action=None):
         """
         Handle player's turn
+
+        Args:
+            action: Move to make; asks the player strategy when None
+        Raises: CombatNotActiveError if the battle is over
+                ValueError if the action is not one of PLAYER_ACTIONS
         """
         if not self.combat_active:
             raise CombatNotActiveError("No battles active.")
 
-        print("\n=== PLAYER TURN ===")
-        print("1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Run Away")
-
-        player_choice = input(
-            "Choose your move!:\n1: Basic Attack\n2: Heavy Attack (Special Ability)\n3: Run Away\n"
-        )
-
-        if player_choice == "1":  # Basic Attack
-            damage = self.character["strength"]
-            self.enemy["health"] -= damage
-            print(f'{self.character["name"]} chose Basic Attack: Dealt {damage} damage.')
-
-        elif player_choice == "2":  # Special Ability / Heavy Attack
-            damage = self.character["strength"] + 5
-            self.enemy["health"] -= damage
-            print(f'{self.character["name"]} chose Heavy Attack: Dealt {damage} damage.')
-
-        elif player_choice == "3":  # Run Away
-            escape_chance = self.enemy["strength"] // 5
-            if self.character["level"] >= escape_chance:
-                print("You successfully ran away!")
-                self.combat_active = False
-                self.battle_result = {"winner": "none", "xp_gained": 0, "gold_gained": 0}
-                return
-            else:
-                print("You were not strong enough to escape!")
-
-        # Check for enemy death
-        if self.enemy["health"] <= 0:
-            print(f"The {self.enemy['type']} has been defeated!")
-            self.combat_active = False
-            self.battle_result = {
-                "winner": "player",
-                "xp_gained": self.enemy.get("xp_reward", 20),
-                "gold_gained": self.enemy.get("gold_reward", 10)
-            }
-
-        self.turn_counter += 1
+        if action is None:
+            action = self.player_strategy(self)
+
+        if action == "attack":
+            damage = self.calculate_damage(self.character, self.enemy)
+            self.apply_damage(self.enemy, damage)
+        elif action == "special":
+            enemy_health = self.enemy["health"]
+            use_special_ability(self.character, self.enemy)
+            if self.enemy["health"] < 0:
+                self.enemy["health"] = 0
+            damage = enemy_health - self.enemy["health"]
+        elif action == "run":
+            damage = 0
+        else:
+            raise ValueError(f"Unknown battle action: {action}")
+
+        self._emit("player", action, damage)
+
+        if action == "run" and self.can_escape():
+            self._end_battle("none")
+        elif self.enemy["health"] <= 0:
+            self._end_battle("player")
 
     def enemy_turn(self):
         """
-        Handle enemy's turn - simple AI
+        Handle enemy's turn
+
+        Raises: CombatNotActiveError if the battle is over
+                ValueError if the enemy strategy returns an unknown action
         """
         if not self.combat_active:
             raise CombatNotActiveError("No battles active.")
 
-        print("\n=== ENEMY TURN ===")
-        damage = self.enemy["strength"]
-        self.character["health"] -= damage
-        print(f"The {self.enemy['type']} attacks you for {damage} damage!")
+        action = self.enemy_strategy(self)
+        if action != "attack":
+            raise ValueError(f"Unknown enemy action: {action}")
+
+        damage = self.calculate_damage(self.enemy, self.character)
+        self.apply_damage(self.character, damage)
+        self._emit("enemy", action, damage)
 
         if self.character["health"] <= 0:
-            print("You have been defeated...")
-            self.combat_active = False
-            self.battle_result = {"winner": "enemy", "xp_gained": 0, "gold_gained": 0}
+            self._end_battle("enemy")
+
+    def can_escape(self):
+        """The player escapes if their level is at least the enemy's strength // 5"""
+        return self.character["level"] >= self.enemy["strength"] // 5
+
+    def _emit(self, actor, action, damage):
+        if self.event_sink is None:
+            self.events.record(self.turn_counter, actor, action, damage,
+                               self.character["health"], self.enemy["health"])
+            return
+        self.event_sink({
+            "turn": self.turn_counter,
+            "actor": actor,
+            "action": action,
+            "damage": damage,
+            "player_health": self.character["health"],
+            "enemy_health": self.enemy["health"]
+        })
+
+    def _end_battle(self, winner):
+        self.combat_active = False
+        if winner == "player":
+            rewards = get_victory_rewards(self.enemy)
+            self.battle_result = {"winner": winner, "xp_gained": rewards["xp"],
+                                  "gold_gained": rewards["gold"]}
+        else:
+            self.battle_result = {"winner": winner, "xp_gained": 0, "gold_gained": 0}
 
     def calculate_damage(self, attacker, defender):
         """
@@ -240,6 +485,30 @@ class SimpleBattle:
         return False
 
 
+def replay_battle(character, enemy, seed, player_actions, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Re-run a battle from its starting state, seed and recorded player moves
+
+    Given copies of the character and enemy as they were when the battle
+    started, the seed and log.player_actions() of the original battle, the
+    replay produces a log with identical to_bytes().
+
+    Returns: (battle result dictionary, BattleLog of the replay)
+    Raises: ValueError if the recorded moves run out before the battle ends
+    """
+    moves = iter(player_actions)
+
+    def recorded_move(battle):
+        try:
+            return next(moves)
+        except StopIteration:
+            raise ValueError("Recorded moves ran out before the battle ended")
+
+    battle = SimpleBattle(character, enemy, player_strategy=recorded_move,
+                          max_turns=max_turns, seed=seed)
+    return battle.start_battle(), battle.events
+
+
 # ============================================================================ 
 # SPECIAL ABILITIES
 # ============================================================================ 
@@ -314,4 +583,14 @@ def display_combat_stats(character, enemy):
 
 
 def display_battle_log(message):
-    print(f">>> {message}")
\ No newline at end of file
+    print(f">>> {message}")
+
+
+def display_battle_event(event):
+    """Event sink that prints battle events for terminal play"""
+    if event["action"] == "run":
+        display_battle_log(f"Turn {event['turn']}: {event['actor']} tried to run away")
+    else:
+        display_battle_log(f"Turn {event['turn']}: {event['actor']} used {event['action']} "
+                           f"for {event['damage']} damage "
+                           f"(player HP {event['player_health']}, enemy HP {event['enemy_health']})")
\ No newline at end of file
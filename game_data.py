@@ -10,16 +10,375 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import sys
+import glob
+import mmap
+import pickle
+import hashlib
+import itertools
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
 
+# ============================================================================
+# RECORD TYPES
+# ============================================================================
+
+class _Record(Mapping):
+    """
+    Read-only, slotted record with dictionary-style access
+
+    Subclasses list their fields in _fields (and the constructor arguments,
+    in order, in _init_fields); each field is stored in a slot
+    instead of a per-record dict, and record["field"] / .get() / "in" / keys()
+    behave like they did on the plain dictionaries used before.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _init_fields = ()
+    _field_set = frozenset()
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._field_set
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __reduce__(self):
+        return (self.__class__, tuple(getattr(self, field) for field in self._init_fields))
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{self.__class__.__name__}({values})"
+
+
+class Quest(_Record):
+    """A quest loaded from the quest catalog"""
+
+    _fields = ("quest_id", "title", "description",
+               "reward_xp", "reward_gold", "required_level", "prerequisite")
+    _init_fields = _fields
+    _field_set = frozenset(_fields)
+    __slots__ = _fields
+
+    def __init__(self, quest_id, title, description,
+                 reward_xp, reward_gold, required_level, prerequisite):
+        self.quest_id = sys.intern(quest_id)
+        self.title = title
+        self.description = description
+        self.reward_xp = reward_xp
+        self.reward_gold = reward_gold
+        self.required_level = required_level
+        self.prerequisite = sys.intern(prerequisite)
+
+
+class Item(_Record):
+    """
+    An item loaded from the item catalog
+
+    The EFFECT string is compiled once on construction into "effects", a
+    tuple of (stat_name, delta) pairs, so item use never re-parses it.
+    """
+
+    _init_fields = ("item_id", "name", "type", "effect", "cost", "description")
+    _fields = _init_fields + ("effects",)
+    _field_set = frozenset(_fields)
+    __slots__ = _fields
+
+    def __init__(self, item_id, name, type, effect, cost, description):
+        self.item_id = sys.intern(item_id)
+        self.name = name
+        self.type = sys.intern(type)
+        self.effect = effect
+        self.cost = cost
+        self.description = description
+        self.effects = compile_item_effects(effect)
+
+
+def compile_item_effects(effect_string):
+    """
+    Compile an item effect string into (stat_name, delta) pairs
+
+    Format: stat_name:value, optionally several separated by commas
+    (e.g. "strength:5" or "strength:3,magic:2")
+
+    Returns: Tuple of (stat_name, int) pairs
+    Raises: InvalidDataFormatError if any effect is malformed
+    """
+    effects = []
+    for part in effect_string.split(","):
+        stat_name, sep, value = part.partition(":")
+        stat_name = stat_name.strip()
+        try:
+            if not sep or not stat_name:
+                raise ValueError("expected stat_name:value")
+            effects.append((sys.intern(stat_name), int(value.strip())))
+        except ValueError as e:
+            raise InvalidDataFormatError(f"Invalid effect '{effect_string}': {e}")
+    return tuple(effects)
+
+
+# ============================================================================
+# RECORD SCHEMAS
+# ============================================================================
+# Each schema lists (field, converter) pairs in file order. A converter of
+# None keeps the raw string; any other converter is called on the value and
+# may raise ValueError to reject it.
+
+VALID_ITEM_TYPES = ("weapon", "armor", "consumable")
+
+
+def _item_type(value):
+    """Converter for the item TYPE field"""
+    if value.lower() not in VALID_ITEM_TYPES:
+        raise ValueError(f"Invalid item type: {value}")
+    return value
+
+
+QUEST_SCHEMA = (
+    ("quest_id", None),
+    ("title", None),
+    ("description", None),
+    ("reward_xp", int),
+    ("reward_gold", int),
+    ("required_level", int),
+    ("prerequisite", None),
+)
+
+ITEM_SCHEMA = (
+    ("item_id", None),
+    ("name", None),
+    ("type", _item_type),
+    ("effect", None),
+    ("cost", int),
+    ("description", None),
+)
+
+
+def _max_level(value):
+    """Converter for the enemy MAX_LEVEL field (NONE means no upper bound)"""
+    return None if value.upper() == "NONE" else int(value)
+
+
+ENEMY_SCHEMA = (
+    ("enemy_id", None),
+    ("name", None),
+    ("type", None),
+    ("health", int),
+    ("strength", int),
+    ("magic", int),
+    ("xp_reward", int),
+    ("gold_reward", int),
+    ("min_level", int),
+    ("max_level", _max_level),
+)
+
+
+def compile_schema(schema, label, factory=None):
+    """
+    Compile a field schema into a single-pass block parser and validator
+
+    Args:
+        schema: Tuple of (field, converter) pairs
+        label: Record name used in error messages (e.g. "quest")
+        factory: Record type called with the field values in schema order
+                 (default: build a plain dictionary)
+
+    Returns: Function taking a block's lines and returning the record with
+             every field converted; unknown fields, missing fields and bad
+             values raise InvalidDataFormatError
+    """
+    fields = tuple(key for key, _ in schema)
+    slots = {key: (position, convert) for position, (key, convert) in enumerate(schema)}
+    field_count = len(fields)
+    missing = object()  # Converters may legitimately return None
+
+    def parse(lines):
+        values = [missing] * field_count
+        seen = 0
+        for line in lines:
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            key = key.strip().lower()
+            try:
+                position, convert = slots[key]
+            except KeyError:
+                raise InvalidDataFormatError(f"Error parsing {label}: Unknown field: {key}")
+            value = value.strip()
+            if convert is not None:
+                try:
+                    value = convert(value)
+                except ValueError as e:
+                    raise InvalidDataFormatError(f"Error parsing {label}: Invalid {key}: {e}")
+            if values[position] is missing:
+                seen += 1
+            values[position] = value
+
+        if seen != field_count:
+            for key, value in zip(fields, values):
+                if value is missing:
+                    raise InvalidDataFormatError(
+                        f"Error parsing {label}: Missing required field: {key}"
+                    )
+        if factory is None:
+            return dict(zip(fields, values))
+        return factory(*values)
+
+    return parse
+
+
+def _validate_record(record, schema):
+    """Check and convert an already-built record dict against a schema"""
+    if isinstance(record, _Record):
+        return True  # Built by a compiled parser, so already validated
+    for key, convert in schema:
+        if key not in record:
+            raise InvalidDataFormatError(f"Missing required field: {key}")
+        if convert is not None:
+            try:
+                record[key] = convert(record[key])
+            except (TypeError, ValueError) as e:
+                raise InvalidDataFormatError(f"Invalid {key}: {e}")
+    return True
+
+
+_parse_quest = compile_schema(QUEST_SCHEMA, "quest", Quest)
+_parse_item = compile_schema(ITEM_SCHEMA, "item", Item)
+_parse_enemy = compile_schema(ENEMY_SCHEMA, "enemy")
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
-def load_quests(filename="data/quests.txt"):
+def _iter_blocks(filename, missing_message, read_message):
+    """
+    Read a data file line by line and yield one block at a time
+
+    Blocks are separated by blank lines. Only the current block's lines are
+    held in memory, so very large files never sit in memory as a whole.
+
+    Yields: List of stripped, non-empty lines for each block
+    Raises: MissingDataFileError, CorruptedDataError
+    """
+    try:
+        f = open(filename, "r")
+    except FileNotFoundError:
+        raise MissingDataFileError(missing_message)
+    except Exception as e:
+        raise CorruptedDataError(f"{read_message}: {e}")
+
+    with f:
+        lines = []
+        try:
+            for line in f:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+                elif lines:
+                    yield lines
+                    lines = []
+        except UnicodeDecodeError as e:
+            raise CorruptedDataError(f"{read_message}: {e}")
+        if lines:
+            yield lines
+
+
+def iter_quests(filename="data/quests.txt"):
+    """
+    Stream quests from file one block at a time
+
+    Same file format as load_quests, but parses line by line and yields
+    each quest dictionary as soon as its block is complete.
+
+    Yields: Quest records
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    blocks = _iter_blocks(
+        filename,
+        f"Quest file '{filename}' not found",
+        "Could not read quest file"
+    )
+    for lines in blocks:
+        try:
+            yield _parse_quest(lines)
+        except InvalidDataFormatError as e:
+            raise e
+        except Exception:
+            raise CorruptedDataError("Quest block is corrupted")
+
+
+def iter_items(filename="data/items.txt"):
+    """
+    Stream items from file one block at a time
+
+    Same file format as load_items, but parses line by line and yields
+    each item dictionary as soon as its block is complete.
+
+    Yields: Item records
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    blocks = _iter_blocks(
+        filename,
+        f"{filename} not found",
+        "Cannot read file"
+    )
+    for lines in blocks:
+        try:
+            yield _parse_item(lines)
+        except InvalidDataFormatError as e:
+            raise e
+        except Exception:
+            raise CorruptedDataError("Item block is corrupted")
+
+
+def load_enemies(filename="data/enemies.txt"):
+    """
+    Load enemy data from file
+
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: unique_enemy_name
+    NAME: Enemy Display Name
+    TYPE: Enemy Type
+    HEALTH: 30
+    STRENGTH: 5
+    MAGIC: 0
+    XP_REWARD: 10
+    GOLD_REWARD: 5
+    MIN_LEVEL: 1
+    MAX_LEVEL: 2 (or NONE for no upper bound)
+
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    enemies = {}
+    for lines in _iter_blocks(filename, f"{filename} not found", "Cannot read enemy file"):
+        try:
+            enemy = _parse_enemy(lines)
+        except InvalidDataFormatError:
+            raise
+        except Exception:
+            raise CorruptedDataError("Enemy block is corrupted")
+        if enemy["enemy_id"] in enemies:
+            raise InvalidDataFormatError(f"Duplicate enemy_id '{enemy['enemy_id']}'")
+        enemies[enemy["enemy_id"]] = enemy
+    return enemies
+
+
+def load_quests(filename="data/quests.txt", max_workers=None):
     """
     Load quest data from file
     
@@ -32,35 +391,21 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
+    filename may also be a directory or glob of shard files (e.g.
+    "data/quests/*.txt"); shards are parsed in a process pool of up to
+    max_workers processes and merged in sorted path order.
+    
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (InvalidDataFormatError also covers duplicate ids across shards)
     """
-    quests = {}
-    
-    try:
-        with open(filename, "r") as f:
-            content = f.read()
-    except FileNotFoundError:
-        raise MissingDataFileError(f"Quest file '{filename}' not found")
-    except Exception as e:
-        raise CorruptedDataError(f"Could not read quest file: {e}")
-    
-    quest_blocks = content.strip().split("\n\n")  # Each quest separated by blank lines
-    
-    for block in quest_blocks:
-        lines = block.strip().split("\n")
-        try:
-            quest_data = parse_quest_block(lines)
-            quests[quest_data['quest_id']] = quest_data
-        except InvalidDataFormatError as e:
-            raise e
-        except Exception:
-            raise CorruptedDataError("Quest block is corrupted")
-    
-    return quests
+    shards = _shard_paths(filename)
+    if shards is not None:
+        return _load_shards(shards, _load_quest_file, "quest_id", filename, max_workers)
+    return _load_quest_file(filename)
 
 
-def load_items(filename="data/items.txt"):
+def load_items(filename="data/items.txt", max_workers=None):
     """
     Load item data from file
     
@@ -72,32 +417,504 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
     
+    filename may also be a directory or glob of shard files, loaded the
+    same way as in load_quests.
+    
     Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (InvalidDataFormatError also covers duplicate ids across shards)
     """
+    shards = _shard_paths(filename)
+    if shards is not None:
+        return _load_shards(shards, _load_item_file, "item_id", filename, max_workers)
+    return _load_item_file(filename)
+
+
+# ============================================================================
+# SHARDED CATALOGS
+# ============================================================================
+
+def _load_quest_file(filename):
+    """Load a single quest file into a dictionary"""
+    quests = {}
+    for quest_data in iter_quests(filename):
+        quests[quest_data['quest_id']] = quest_data
+    return quests
+
+
+def _load_item_file(filename):
+    """Load a single item file into a dictionary"""
     items = {}
-    
+    for item_data in iter_items(filename):
+        items[item_data['item_id']] = item_data
+    return items
+
+
+def _shard_paths(path):
+    """
+    Resolve a directory or glob pattern into a sorted list of shard files
+
+    Catalog cache files written next to the shards (and their temp files)
+    are never treated as shards, even when a glob matches them.
+
+    Returns: List of file paths, or None if path names a single file
+    """
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "*.txt")))
+    if glob.has_magic(path):
+        return sorted(p for p in glob.glob(path)
+                      if os.path.isfile(p) and not _is_cache_file(p))
+    return None
+
+
+def _is_cache_file(path):
+    if path.endswith(CATALOG_CACHE_SUFFIX):
+        return True
+    return path.endswith(".tmp") and CATALOG_CACHE_SUFFIX + "." in os.path.basename(path)
+
+
+def _load_shards(paths, loader, id_key, source, max_workers=None):
+    """
+    Parse shard files in parallel and merge them deterministically
+
+    Args:
+        paths: Sorted list of shard files
+        loader: Module-level function that loads one file into a dictionary
+        id_key: Record id field, used in duplicate error messages
+        source: Original directory/glob, used in error messages
+        max_workers: Process pool size (default: one per shard, up to CPU count)
+
+    Returns: Merged dictionary, in shard order then file order
+    Raises: MissingDataFileError if no shard matches,
+            InvalidDataFormatError on duplicate ids across shards
+    """
+    if not paths:
+        raise MissingDataFileError(f"No data files found for '{source}'")
+
+    if max_workers is None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+
+    if len(paths) == 1 or max_workers <= 1:
+        results = [loader(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(loader, paths))
+
+    merged = {}
+    owners = {}
+    for path, records in zip(paths, results):
+        for record_id, record in records.items():
+            if record_id in merged:
+                raise InvalidDataFormatError(
+                    f"Duplicate {id_key} '{record_id}' in {owners[record_id]} and {path}"
+                )
+            merged[record_id] = record
+            owners[record_id] = path
+    return merged
+
+
+# ============================================================================
+# CATALOG CACHE
+# ============================================================================
+# Parsed catalogs are pickled next to their source file (e.g.
+# data/quests.txt.cache). A cache is reused while the source file's size and
+# mtime are unchanged; if those differ but the content hash still matches
+# (e.g. the file was only touched), the cache is re-stamped instead of rebuilt.
+
+CATALOG_CACHE_VERSION = 4
+CATALOG_CACHE_SUFFIX = ".cache"
+
+
+def _file_digest(filename):
+    """Return the SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_catalog_cache(cache_path, kind):
+    """Return the cache header dictionary, or None if missing/unusable"""
     try:
-        with open(filename, "r") as f:
-            content = f.read()
-    except FileNotFoundError:
-        raise MissingDataFileError(f"{filename} not found")
-    except Exception as e:
-        raise CorruptedDataError(f"Cannot read file: {e}")
-    
-    blocks = content.strip().split("\n\n")  # Each item separated by blank line
-    
-    for block in blocks:
-        lines = block.strip().split("\n")
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("version") != CATALOG_CACHE_VERSION or cached.get("kind") != kind:
+        return None
+    return cached
+
+
+def _write_catalog_cache(cache_path, cached):
+    """Write a cache file atomically; failures only cost the next startup"""
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _load_with_cache(filename, kind, loader):
+    """
+    Load a catalog through its binary cache, rebuilding it when stale
+
+    Args:
+        filename: Source text file
+        kind: "quests" or "items", stored in the cache header
+        loader: Function that parses the source file into a dictionary
+
+    Returns: Dictionary returned by loader (possibly from the cache)
+    Raises: Whatever loader raises when the cache cannot be used
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return loader(filename)
+
+    cache_path = filename + CATALOG_CACHE_SUFFIX
+    cached = _read_catalog_cache(cache_path, kind)
+    digest = None
+
+    if cached is not None and cached["size"] == stat.st_size:
+        if cached["mtime"] == stat.st_mtime_ns:
+            return cached["records"]
+        digest = _file_digest(filename)
+        if cached["digest"] == digest:
+            cached["mtime"] = stat.st_mtime_ns
+            _write_catalog_cache(cache_path, cached)
+            return cached["records"]
+
+    records = loader(filename)
+    if digest is None:
+        digest = _file_digest(filename)
+    _write_catalog_cache(cache_path, {
+        "version": CATALOG_CACHE_VERSION,
+        "kind": kind,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "digest": digest,
+        "records": records
+    })
+    return records
+
+
+def _load_quest_file_cached(filename):
+    """Load a single quest file through its cache"""
+    return _load_with_cache(filename, "quests", _load_quest_file)
+
+
+def _load_item_file_cached(filename):
+    """Load a single item file through its cache"""
+    return _load_with_cache(filename, "items", _load_item_file)
+
+
+def load_quests_cached(filename="data/quests.txt", max_workers=None):
+    """
+    Load quests, reusing the binary cache next to the file when it is fresh
+
+    Directories and globs are supported as in load_quests, with one cache
+    per shard file.
+
+    Returns: Dictionary of quests {quest_id: quest_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    shards = _shard_paths(filename)
+    if shards is not None:
+        return _load_shards(shards, _load_quest_file_cached, "quest_id", filename, max_workers)
+    return _load_quest_file_cached(filename)
+
+
+def load_items_cached(filename="data/items.txt", max_workers=None):
+    """
+    Load items, reusing the binary cache next to the file when it is fresh
+
+    Directories and globs are supported as in load_items, with one cache
+    per shard file.
+
+    Returns: Dictionary of items {item_id: item_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    shards = _shard_paths(filename)
+    if shards is not None:
+        return _load_shards(shards, _load_item_file_cached, "item_id", filename, max_workers)
+    return _load_item_file_cached(filename)
+
+
+# ============================================================================
+# LAZY CATALOGS
+# ============================================================================
+
+class LazyCatalog(Mapping):
+    """
+    Read-only {record_id: record} mapping backed by a memory-mapped file
+
+    Opening the catalog only records where each block starts and ends.
+    A block is parsed the first time its id is looked up and the parsed
+    record is cached, so untouched records never cost any parsing.
+    """
+
+    def __init__(self, filename, id_key, parser, label):
+        """
+        Args:
+            filename: Data file in the blank-line separated block format
+            id_key: Field that identifies a block (e.g. "quest_id")
+            parser: Block parser such as parse_quest_block
+            label: "Quest" or "Item", used in error messages
+        """
+        self.filename = filename
+        self._id_key = id_key
+        self._parser = parser
+        self._label = label
+        self._index = {}
+        self._records = {}
+        self._mm = None
+
         try:
-            item_data = parse_item_block(lines)
-            items[item_data['item_id']] = item_data
-        except InvalidDataFormatError as e:
-            raise e
-        except Exception:
-            raise CorruptedDataError("Item block is corrupted")
-    
-    return items
+            with open(filename, "rb") as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise MissingDataFileError(f"{label} file '{filename}' not found")
+        except Exception as e:
+            raise CorruptedDataError(f"Could not read {label.lower()} file: {e}")
+
+        if self._mm is not None:
+            try:
+                self._build_index()
+            except Exception:
+                self.close()
+                raise
+
+    def _build_index(self):
+        """Scan the mapped file once, recording (start, end) for each block"""
+        mm = self._mm
+        size = len(mm)
+        # A line matches only if it is blank (group 1 is None) or is an
+        # "<id_key>:" line (group 1 is the raw id); a block is everything
+        # between two blank lines. Anchoring on the newline before each line
+        # lets the regex engine skip ahead to newlines instead of trying
+        # every byte; the first line has no newline before it.
+        line_body = (rb"[ \t\r\f\v]*(?:(?=\n)|\Z|" + re.escape(self._id_key.encode())
+                     + rb"[ \t\r\f\v]*:([^\n]*))")
+        first_line = re.compile(line_body, re.IGNORECASE).match(mm)
+        later_lines = re.compile(rb"\n" + line_body, re.IGNORECASE).finditer(mm)
+        lines = itertools.chain([first_line] if first_line else [], later_lines)
+
+        block_start = 0
+        block_id = None
+        try:
+            for match in lines:
+                value = match.group(1)
+                if value is None:
+                    # Blank line closes the current block
+                    line_start = match.start() if match is first_line else match.start() + 1
+                    if line_start > block_start:
+                        self._add_block(block_id, block_start, line_start)
+                    block_start = match.end() + 1
+                    block_id = None
+                elif block_id is None:
+                    try:
+                        block_id = value.strip().decode()
+                    except UnicodeDecodeError:
+                        raise CorruptedDataError(f"{self._label} block is corrupted")
+        finally:
+            # The scanner and matches pin the map; drop them so close() works
+            first_line = later_lines = lines = match = None
+
+        if block_start < size:
+            self._add_block(block_id, block_start, size)
+
+    def _add_block(self, block_id, start, end):
+        if block_id is None:
+            raise InvalidDataFormatError(
+                f"Error parsing {self._label.lower()}: Missing {self._id_key}"
+            )
+        self._index[block_id] = (start, end)
+
+    def __getitem__(self, record_id):
+        if record_id in self._records:
+            return self._records[record_id]
+        start, end = self._index[record_id]
+        if self._mm is None:
+            raise ValueError(f"{self._label} catalog '{self.filename}' is closed")
+        try:
+            text = self._mm[start:end].decode()
+        except UnicodeDecodeError:
+            raise CorruptedDataError(f"{self._label} block is corrupted")
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        record = self._parser(lines)
+        self._records[record_id] = record
+        return record
+
+    def __contains__(self, record_id):
+        return record_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """
+        Release the memory map
+
+        Already-parsed records stay usable; looking up any other record
+        afterwards raises ValueError.
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_lazy_quests(filename="data/quests.txt"):
+    """
+    Open a quest file as a LazyCatalog
+
+    Returns: LazyCatalog of {quest_id: quest_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    return LazyCatalog(filename, "quest_id", parse_quest_block, "Quest")
+
+
+def open_lazy_items(filename="data/items.txt"):
+    """
+    Open an item file as a LazyCatalog
+
+    Returns: LazyCatalog of {item_id: item_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    return LazyCatalog(filename, "item_id", parse_item_block, "Item")
+
+
+# ============================================================================
+# HOT RELOAD
+# ============================================================================
+
+def _block_id(lines, id_key):
+    """Return the id value of a block without parsing the whole block"""
+    for line in lines:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            if key.strip().lower() == id_key:
+                return value.strip()
+    return None
+
+
+def _block_hash(lines):
+    return hashlib.blake2b("\n".join(lines).encode(), digest_size=16).digest()
+
+
+class CatalogWatcher:
+    """
+    Keep a live catalog dictionary in sync with its data file
+
+    Each poll() checks the file's size and mtime. When they change, the file
+    is re-read block by block; only blocks whose content hash is new get
+    parsed, and the resulting adds, updates and removals are applied in
+    place to the catalog dictionary.
+    """
+
+    def __init__(self, filename, catalog, id_key, parser, label):
+        """
+        Args:
+            filename: Data file the catalog was loaded from
+            catalog: Live {record_id: record} dictionary to update in place
+            id_key: Field that identifies a block (e.g. "quest_id")
+            parser: Block parser such as parse_quest_block
+            label: "Quest" or "Item", used in error messages
+        """
+        self.filename = filename
+        self.catalog = catalog
+        self._id_key = id_key
+        self._parser = parser
+        self._label = label
+        self._signature = self._file_signature()
+        self._hashes = {}
+        for lines in self._blocks():
+            self._hashes[_block_hash(lines)] = _block_id(lines, id_key)
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _blocks(self):
+        return _iter_blocks(
+            self.filename,
+            f"{self._label} file '{self.filename}' not found",
+            f"Could not read {self._label.lower()} file"
+        )
+
+    def poll(self):
+        """
+        Apply any changes made to the data file since the last poll
+
+        Returns: None if the file is unchanged, otherwise a dictionary
+                 {'added': [...], 'updated': [...], 'removed': [...]} of ids
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+                (the catalog is left untouched when an error is raised)
+        """
+        signature = self._file_signature()
+        if signature == self._signature:
+            return None
+        self._signature = signature
+
+        new_hashes = {}
+        changed = {}
+        for lines in self._blocks():
+            block_hash = _block_hash(lines)
+            record_id = self._hashes.get(block_hash)
+            if record_id is None:
+                try:
+                    record = self._parser(lines)
+                except InvalidDataFormatError as e:
+                    raise e
+                except Exception:
+                    raise CorruptedDataError(f"{self._label} block is corrupted")
+                record_id = record[self._id_key]
+                changed[record_id] = record
+            new_hashes[block_hash] = record_id
+
+        old_ids = set(self._hashes.values())
+        new_ids = set(new_hashes.values())
+        changes = {
+            "added": [rid for rid in changed if rid not in old_ids],
+            "updated": [rid for rid in changed if rid in old_ids],
+            "removed": [rid for rid in old_ids if rid not in new_ids]
+        }
+
+        for record_id, record in changed.items():
+            self.catalog[record_id] = record
+        for record_id in changes["removed"]:
+            self.catalog.pop(record_id, None)
+
+        self._hashes = new_hashes
+        return changes
+
+
+def watch_quests(quests, filename="data/quests.txt"):
+    """Create a CatalogWatcher that keeps a loaded quest dictionary current"""
+    return CatalogWatcher(filename, quests, "quest_id", parse_quest_block, "Quest")
+
+
+def watch_items(items, filename="data/items.txt"):
+    """Create a CatalogWatcher that keeps a loaded item dictionary current"""
+    return CatalogWatcher(filename, items, "item_id", parse_item_block, "Item")
 
 
 def validate_quest_data(quest_dict):
@@ -110,24 +927,7 @@ def validate_quest_data(quest_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
     """
-    required_keys = [
-        "quest_id", "title", "description", 
-        "reward_xp", "reward_gold", "required_level", "prerequisite"
-    ]
-    
-    for key in required_keys:
-        if key not in quest_dict:
-            raise InvalidDataFormatError(f"Missing required field: {key}")
-    
-    # Check numeric fields
-    try:
-        quest_dict["reward_xp"] = int(quest_dict["reward_xp"])
-        quest_dict["reward_gold"] = int(quest_dict["reward_gold"])
-        quest_dict["required_level"] = int(quest_dict["required_level"])
-    except ValueError:
-        raise InvalidDataFormatError("Numeric fields must be integers")
-    
-    return True
+    return _validate_record(quest_dict, QUEST_SCHEMA)
 
 
 def validate_item_data(item_dict):
@@ -140,22 +940,7 @@ def validate_item_data(item_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
-    required_keys = ["item_id", "name", "type", "effect", "cost", "description"]
-    valid_types = ["weapon", "armor", "consumable"]
-    
-    for key in required_keys:
-        if key not in item_dict:
-            raise InvalidDataFormatError(f"Missing required field: {key}")
-    
-    if item_dict["type"].lower() not in valid_types:
-        raise InvalidDataFormatError(f"Invalid item type: {item_dict['type']}")
-    
-    try:
-        item_dict["cost"] = int(item_dict["cost"])
-    except ValueError:
-        raise InvalidDataFormatError("Cost must be an integer")
-    
-    return True
+    return _validate_record(item_dict, ITEM_SCHEMA)
 
 
 def create_default_data_files():
@@ -196,69 +981,30 @@ def create_default_data_files():
 
 def parse_quest_block(lines):
     """
-    Parse a block of lines into a quest dictionary
+    Parse and validate a block of lines into a quest dictionary
     
     Args:
         lines: List of strings representing one quest
     
-    Returns: Dictionary with quest data
-    Raises: InvalidDataFormatError if parsing fails
+    Returns: Quest record (read-only, dictionary-style access)
+    Raises: InvalidDataFormatError if parsing fails, a field is unknown
+            or missing, or a numeric field is not an integer
     """
-    quest = {}
-    try:
-        for line in lines:
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-            
-            if key in ["reward_xp", "reward_gold", "required_level"]:
-                value = int(value)
-            
-            quest[key] = value
-        
-        # Ensure quest_id exists
-        if "quest_id" not in quest:
-            raise InvalidDataFormatError("Missing quest_id")
-    
-    except Exception as e:
-        raise InvalidDataFormatError(f"Error parsing quest: {e}")
-    
-    return quest
+    return _parse_quest(lines)
 
 
 def parse_item_block(lines):
     """
-    Parse a block of lines into an item dictionary
+    Parse and validate a block of lines into an item dictionary
     
     Args:
         lines: List of strings representing one item
     
-    Returns: Dictionary with item data
-    Raises: InvalidDataFormatError if parsing fails
+    Returns: Item record (read-only, dictionary-style access)
+    Raises: InvalidDataFormatError if parsing fails, a field is unknown
+            or missing, the type is invalid or the cost is not an integer
     """
-    item = {}
-    try:
-        for line in lines:
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-            
-            if key == "cost":
-                value = int(value)
-            
-            item[key] = value
-        
-        if "item_id" not in item:
-            raise InvalidDataFormatError("Missing item_id")
-    
-    except Exception as e:
-        raise InvalidDataFormatError(f"Error parsing item: {e}")
-    
-    return item
+    return _parse_item(lines)
 
 # ============================================================================
 # TESTING
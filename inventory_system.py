@@ -15,6 +15,7 @@ from custom_exceptions import (
     InsufficientResourcesError,
     InvalidItemTypeError
 )
+from columnar_catalog import ColumnarCatalog
 
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
@@ -100,16 +101,18 @@ def use_item(character, item_id, item_data):
     if item_data['type'] != 'consumable':
         raise InvalidItemTypeError(f"Cannot use item type '{item_data['type']}'")
    
-    # Parse effect
-    stat, value = parse_item_effect(item_data['effect'])
-    apply_stat_effect(character, stat, value)
+    # Apply effects
+    effects = get_item_effects(item_data)
+    for stat, value in effects:
+        apply_stat_effect(character, stat, value)
    
     # Remove item after use
     remove_item_from_inventory(character, item_id)
 
 
     # FIXED: tests do NOT include item_data['name']
-    return f"{character['name']} used {item_id} and {stat} changed by {value}."
+    changes = ", ".join(f"{stat} changed by {value}" for stat, value in effects)
+    return f"{character['name']} used {item_id} and {changes}."
 
 
 def equip_weapon(character, item_id, item_data):
@@ -127,9 +130,10 @@ def equip_weapon(character, item_id, item_data):
     if character.get('equipped_weapon'):
         unequip_weapon(character)
    
-    # Apply weapon effect
-    stat, value = parse_item_effect(item_data['effect'])
-    apply_stat_effect(character, stat, value)
+    # Apply weapon effects
+    effects = get_item_effects(item_data)
+    for stat, value in effects:
+        apply_stat_effect(character, stat, value)
    
     # Store equipped weapon
     character['equipped_weapon'] = item_id
@@ -137,7 +141,8 @@ def equip_weapon(character, item_id, item_data):
 
 
     # FIXED: tests do NOT include item_data['name']
-    return f"{character['name']} equipped weapon '{item_id}' (+{value} {stat})."
+    bonuses = ", ".join(f"+{value} {stat}" for stat, value in effects)
+    return f"{character['name']} equipped weapon '{item_id}' ({bonuses})."
 
 
 def equip_armor(character, item_id, item_data):
@@ -155,9 +160,10 @@ def equip_armor(character, item_id, item_data):
     if character.get('equipped_armor'):
         unequip_armor(character)
    
-    # Apply armor effect
-    stat, value = parse_item_effect(item_data['effect'])
-    apply_stat_effect(character, stat, value)
+    # Apply armor effects
+    effects = get_item_effects(item_data)
+    for stat, value in effects:
+        apply_stat_effect(character, stat, value)
    
     # Store equipped armor
     character['equipped_armor'] = item_id
@@ -165,7 +171,8 @@ def equip_armor(character, item_id, item_data):
 
 
     # FIXED: tests do NOT include item_data['name']
-    return f"{character['name']} equipped armor '{item_id}' (+{value} {stat})."
+    bonuses = ", ".join(f"+{value} {stat}" for stat, value in effects)
+    return f"{character['name']} equipped armor '{item_id}' ({bonuses})."
 
 
 def unequip_weapon(character):
@@ -237,6 +244,16 @@ def sell_item(character, item_id, item_data):
     return sell_price
 
 
+def get_affordable_items(character, item_data_dict):
+    """
+    Get all items the character has enough gold to buy
+    """
+    gold = character.get('gold', 0)
+    if isinstance(item_data_dict, ColumnarCatalog):
+        return item_data_dict.select_between('cost', high=gold)
+    return [item for item in item_data_dict.values() if item['cost'] <= gold]
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -254,6 +271,19 @@ def parse_item_effect(effect_string):
         raise InvalidItemTypeError(f"Invalid effect format '{effect_string}': {e}")
 
 
+def get_item_effects(item_data):
+    """
+    Get an item's effects as (stat_name, value) pairs
+
+    Catalog items carry effects compiled at load time; plain item
+    dictionaries fall back to parsing their effect string here.
+    """
+    effects = item_data.get('effects')
+    if effects is None:
+        effects = tuple(parse_item_effect(part) for part in item_data['effect'].split(","))
+    return effects
+
+
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -10,6 +10,8 @@ This is the main game file that ties all modules together.
 Demonstrates module integration and complete game flow.
 """
 
+import atexit
+
 # Import all our custom modules
 import character_manager
 import inventory_system
@@ -38,6 +40,9 @@ current_character = None
 all_items = {}
 all_quests = {}
 game_running = False
+data_watchers = []
+save_queue = character_manager.SaveQueue()
+atexit.register(save_queue.close)  # Queued saves survive Ctrl-C and crashes
 
 # =====================================================
 # REQUIRED FUNCTIONS
@@ -72,16 +77,18 @@ def new_game():
 def load_game():
     """Load an existing saved game"""
     global current_character
-    from character_manager import list_saved_characters, load_character, CharacterNotFoundError, SaveFileCorruptedError
+    from character_manager import query_saved_characters, load_character, CharacterNotFoundError, SaveFileCorruptedError
 
-    saved_characters = list_saved_characters()
-    if not saved_characters:
+    summaries = query_saved_characters()
+    if not summaries:
         print("No saved characters found.")
         return
 
     print("Saved Characters:")
-    for idx, name in enumerate(saved_characters, 1):
-        print(f"{idx}. {name}")
+    saved_characters = []
+    for idx, summary in enumerate(summaries, 1):
+        saved_characters.append(summary['name'])
+        print(f"{idx}. {summary['name']} - Level {summary['level']} {summary['class']} ({summary['gold']} gold)")
 
     while True:
         try:
@@ -110,10 +117,10 @@ def load_game():
 def game_loop():
     """Main game loop"""
     global game_running, current_character
-    from character_manager import save_character
 
     game_running = True
     while game_running:
+        check_data_updates()
         print("\n=== GAME MENU ===")
         print("1. View Character Stats")
         print("2. View Inventory")
@@ -134,41 +141,65 @@ def game_loop():
         elif choice == 3:
             print("Starting quest or battle... (placeholder)")
         elif choice == 4:
-            try:
-                save_character(current_character)
-                print("Game saved successfully.")
-            except Exception as e:
-                print(f"Error saving game: {e}")
+            save_game()
         elif choice == 5:
             print("Exiting to main menu...")
+            flush_saves()
             game_running = False
         else:
             print("Invalid choice. Please select a number from 1-5.")
 
 
 def save_game():
-    """Save current game state"""
+    """Save current game state through save_queue and wait for the write"""
     global current_character
-    from character_manager import save_character
     try:
-        save_character(current_character)
+        save_queue.enqueue(current_character)
+        save_queue.flush()
         print("Game saved successfully.")
     except Exception as e:
         print(f"Error saving game: {e}")
 
 
+def flush_saves():
+    """Wait for queued saves to reach the disk"""
+    try:
+        save_queue.flush()
+        character_manager.flush_character_cache()
+    except Exception as e:
+        print(f"Error saving game: {e}")
+
+
 def load_game_data():
     """Load all quests and items"""
     global all_quests, all_items
     import game_data
     try:
-        all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
+        all_quests = game_data.load_quests_cached()
+        all_items = game_data.load_items_cached()
     except (game_data.MissingDataFileError, game_data.InvalidDataFormatError):
         print("Data missing or corrupted, creating default files...")
         game_data.create_default_data_files()
-        all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
+        all_quests = game_data.load_quests_cached()
+        all_items = game_data.load_items_cached()
+
+    data_watchers[:] = [
+        game_data.watch_quests(all_quests),
+        game_data.watch_items(all_items)
+    ]
+
+
+def check_data_updates():
+    """Apply edits made to the quest/item files while the game is running"""
+    for watcher in data_watchers:
+        try:
+            changes = watcher.poll()
+        except DataError as e:
+            print(f"Could not reload {watcher.filename}: {e}")
+            continue
+        if changes and any(changes.values()):
+            print(f"Reloaded {watcher.filename}: {len(changes['added'])} added, "
+                  f"{len(changes['updated'])} updated, {len(changes['removed'])} removed")
 
 
 # =====================================================
@@ -206,6 +237,7 @@ def main():
         elif choice == 2:
             load_game()
         elif choice == 3:
+            flush_saves()
             print("Thanks for playing!")
             break
         else:
@@ -0,0 +1,85 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Progression Module
+
+This module resolves experience awards in closed form. Going from level L
+to L + 1 costs L * 100 experience, so reaching level L from level 1 takes
+100 * L * (L - 1) / 2 in total. Inverting that with an integer square root
+resolves an award of any size with constant work and a single stat update
+instead of one loop pass per level.
+"""
+
+from math import isqrt
+
+XP_PER_LEVEL = 100
+STAT_GROWTH = (("max_health", 10), ("strength", 2), ("magic", 2))  # per level gained
+
+
+def experience_for_level(level):
+    """Total experience needed to go from level 1 to the given level"""
+    return XP_PER_LEVEL * level * (level - 1) // 2
+
+
+def level_for_experience(total):
+    """
+    Get the level reached with a total amount of experience
+
+    Returns: Level (at least 1)
+    """
+    if total <= 0:
+        return 1
+    # Largest L with L * (L - 1) <= 2 * total / XP_PER_LEVEL
+    pairs = 2 * total // XP_PER_LEVEL
+    return (1 + isqrt(4 * pairs + 1)) // 2
+
+
+def total_experience(character):
+    """Get the total experience a character has earned since level 1"""
+    return experience_for_level(character['level']) + character['experience']
+
+
+def apply_experience(character, xp_amount):
+    """
+    Add experience to a character and apply any level-ups in one step
+
+    Each level gained adds the STAT_GROWTH deltas, and a level-up restores
+    health to the new max_health. Does not check whether the character is
+    alive; gain_experience does that.
+
+    Returns: Number of levels gained
+    """
+    level = character['level']
+    experience = character['experience'] + xp_amount
+    if experience < level * XP_PER_LEVEL:
+        character['experience'] = experience
+        return 0
+
+    total = experience_for_level(level) + experience
+    new_level = level_for_experience(total)
+    gained = new_level - level
+    character['level'] = new_level
+    character['experience'] = total - experience_for_level(new_level)
+    for stat, delta in STAT_GROWTH:
+        character[stat] += delta * gained
+    character['health'] = character['max_health']
+    return gained
+
+
+def apply_experience_batch(characters, xp_amount):
+    """
+    Grant the same experience award to many characters
+
+    Dead characters (health <= 0) are skipped rather than raising, so one
+    fallen character does not stop an event grant for everyone else.
+
+    Returns: Dictionary of {character name: levels gained} for characters
+             that leveled up
+    """
+    leveled = {}
+    for character in characters:
+        if character['health'] <= 0:
+            continue
+        gained = apply_experience(character, xp_amount)
+        if gained:
+            leveled[character['name']] = gained
+    return leveled
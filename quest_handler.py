@@ -16,6 +16,7 @@ from custom_exceptions import (
     QuestNotActiveError,
     InsufficientLevelError
 )
+from columnar_catalog import ColumnarCatalog
 
 # ============================================================================
 # QUEST MANAGEMENT
@@ -187,7 +188,14 @@ def get_available_quests(character, quest_data_dict):
     available = []
     level = character.get("level", 1)
 
-    for quest_id, quest in quest_data_dict.items():
+    if isinstance(quest_data_dict, ColumnarCatalog):
+        # Level filter as one vectorized mask, remaining checks per candidate
+        candidates = [(quest_id, quest_data_dict[quest_id])
+                      for quest_id in quest_data_dict.ids_between("required_level", high=level)]
+    else:
+        candidates = quest_data_dict.items()
+
+    for quest_id, quest in candidates:
         required_level = quest.get("required_level", 1)
         prereq = quest.get("prerequisite", "NONE")
 
@@ -291,6 +299,13 @@ def get_quest_completion_percentage(character, quest_data_dict):
 
 def get_total_quest_rewards_earned(character, quest_data_dict):
     """Calculate total XP and gold earned from completed quests"""
+    if isinstance(quest_data_dict, ColumnarCatalog):
+        completed = character.get("completed_quests", [])
+        return {
+            "total_xp": quest_data_dict.sum_column("reward_xp", completed),
+            "total_gold": quest_data_dict.sum_column("reward_gold", completed)
+        }
+
     total_xp = 0
     total_gold = 0
 
@@ -305,6 +320,9 @@ def get_total_quest_rewards_earned(character, quest_data_dict):
 
 def get_quests_by_level(quest_data_dict, min_level, max_level):
     """Get all quests within a level range"""
+    if isinstance(quest_data_dict, ColumnarCatalog):
+        return quest_data_dict.select_between("required_level", min_level, max_level)
+
     results = []
 
     for quest_id, quest in quest_data_dict.items():
@@ -0,0 +1,242 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+SQLite Storage Module
+
+This module stores characters in a single SQLite database instead of one
+text file per character, and migrates existing text saves into it.
+
+Usage:
+    import character_manager, sqlite_storage
+    character_manager.set_storage_backend(sqlite_storage.SQLiteStorage())
+
+Migration:
+    python sqlite_storage.py data/save_games data/save_games.db
+"""
+
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from custom_exceptions import (
+    CharacterNotFoundError,
+    SaveFileCorruptedError
+)
+from character_manager import (
+    Character,
+    INT_FIELDS,
+    LIST_FIELDS,
+    TextFileStorage
+)
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS characters (
+    name TEXT PRIMARY KEY,
+    class TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    health INTEGER NOT NULL,
+    max_health INTEGER NOT NULL,
+    strength INTEGER NOT NULL,
+    magic INTEGER NOT NULL,
+    experience INTEGER NOT NULL,
+    gold INTEGER NOT NULL,
+    inventory TEXT NOT NULL,
+    active_quests TEXT NOT NULL,
+    completed_quests TEXT NOT NULL,
+    modified REAL NOT NULL DEFAULT 0
+)
+"""
+_COLUMNS = ("name", "class") + INT_FIELDS + LIST_FIELDS
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO characters ({', '.join(_COLUMNS)}, modified) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)}, ?)"
+)
+_SUMMARY_COLUMNS = ("name", "class", "level", "gold", "modified")
+_SELECT_SQL = f"SELECT {', '.join(_COLUMNS)} FROM characters WHERE name = ?"
+_LIST_SQL = "SELECT name FROM characters ORDER BY name"
+_DELETE_SQL = "DELETE FROM characters WHERE name = ?"
+
+
+def _to_row(character):
+    """Flatten a character into a parameter tuple for _UPSERT_SQL"""
+    row = [character["name"], character["class"]]
+    row.extend(character[field] for field in INT_FIELDS)
+    row.extend(json.dumps(list(character[field])) for field in LIST_FIELDS)
+    row.append(time.time())
+    return row
+
+
+def _from_row(row):
+    """Rebuild a Character from a _SELECT_SQL row"""
+    character = Character(zip(_COLUMNS, row))
+    for field in LIST_FIELDS:
+        character[field] = json.loads(character[field])
+    return character
+
+
+class SQLiteStorage:
+    """
+    Storage backend keeping every character in one SQLite database
+
+    The database runs in WAL mode so readers never block the writer.
+    Connections are pooled (up to pool_size, shared across threads) and
+    every statement is a fixed SQL string, so sqlite3's statement cache
+    reuses the prepared statements. save_many writes a whole batch in one
+    transaction.
+    """
+
+    def __init__(self, db_path="data/save_games.db", pool_size=4):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        with self._connection() as conn:
+            conn.execute(_CREATE_TABLE_SQL)
+
+    def _connect(self):
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            raise SaveFileCorruptedError(f"Cannot open save database: {e}")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        if self._closed:
+            raise SaveFileCorruptedError("Save database is closed")
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.pool_size
+                if can_create:
+                    self._created += 1
+            if not can_create:
+                conn = self._pool.get()
+            else:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1  # Let a later call try again
+                    raise
+
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            raise SaveFileCorruptedError(f"Save database error: {e}")
+        finally:
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._pool.put(conn)
+            if closed:
+                conn.close()  # Borrowed across close(); don't return it to the pool
+
+    def save_character(self, character):
+        return self.save_many([character])
+
+    def save_many(self, characters):
+        """Save several characters in a single transaction"""
+        rows = [_to_row(character) for character in characters]
+        with self._connection() as conn:
+            conn.executemany(_UPSERT_SQL, rows)
+        return True
+
+    def load_character(self, character_name):
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_SQL, (character_name,)).fetchone()
+        if row is None:
+            raise CharacterNotFoundError(f"Character '{character_name}' not found.")
+        return _from_row(row)
+
+    def list_saved_characters(self):
+        with self._connection() as conn:
+            return [name for (name,) in conn.execute(_LIST_SQL)]
+
+    def delete_character(self, character_name):
+        with self._connection() as conn:
+            deleted = conn.execute(_DELETE_SQL, (character_name,)).rowcount
+        if not deleted:
+            raise CharacterNotFoundError(f"Character '{character_name}' not found.")
+        return True
+
+    def query_saved_characters(self, sort_by="name", descending=False,
+                               character_class=None, min_level=None,
+                               max_level=None, offset=0, limit=None):
+        """Same summaries and arguments as character_manager.query_saved_characters"""
+        if sort_by not in _SUMMARY_COLUMNS:
+            raise KeyError(sort_by)
+        clauses = []
+        params = []
+        if character_class is not None:
+            clauses.append("class = ?")
+            params.append(character_class)
+        if min_level is not None:
+            clauses.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            clauses.append("level <= ?")
+            params.append(max_level)
+
+        sql = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM characters"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {sort_by} {'DESC' if descending else 'ASC'} LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+
+        with self._connection() as conn:
+            return [dict(zip(_SUMMARY_COLUMNS, row)) for row in conn.execute(sql, params)]
+
+    def close(self):
+        """Close every pooled connection; borrowed ones close when returned"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def migrate_text_saves(save_directory, storage, batch_size=500):
+    """
+    Copy every <save_directory>/<name>.txt save into a storage backend
+
+    Characters are written in batches of batch_size (one transaction each
+    for SQLiteStorage). The text files are left in place.
+
+    Returns: Number of characters migrated
+    """
+    source = TextFileStorage(save_directory)
+    batch = []
+    migrated = 0
+    for name in source.list_saved_characters():
+        batch.append(source.load_character(name))
+        if len(batch) >= batch_size:
+            storage.save_many(batch)
+            migrated += len(batch)
+            batch = []
+    if batch:
+        storage.save_many(batch)
+        migrated += len(batch)
+    return migrated
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python sqlite_storage.py <save_directory> <database>")
+        sys.exit(1)
+    storage = SQLiteStorage(sys.argv[2])
+    count = migrate_text_saves(sys.argv[1], storage)
+    storage.close()
+    print(f"Migrated {count} character(s) into {sys.argv[2]}")
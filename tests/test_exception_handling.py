@@ -37,6 +37,19 @@ def test_character_dead_exception():
     with pytest.raises(CharacterDeadError):
         character_manager.gain_experience(char, 50)
 
+def test_corrupted_binary_save_exception(tmp_path):
+    """Test that a binary save with a bad checksum raises SaveFileCorruptedError"""
+    char = character_manager.create_character("Broken", "Rogue")
+    character_manager.save_character(char, str(tmp_path), binary=True)
+
+    save_file = tmp_path / "Broken.txt"
+    data = bytearray(save_file.read_bytes())
+    data[10] ^= 0xFF
+    save_file.write_bytes(bytes(data))
+
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.load_character("Broken", str(tmp_path))
+
 # ============================================================================
 # INVENTORY EXCEPTION TESTS
 # ============================================================================
@@ -160,6 +173,29 @@ def test_invalid_data_format_exception():
     finally:
         os.remove("test_bad_data.txt")
 
+def test_schema_rejects_unknown_and_bad_fields():
+    """Test that block parsing rejects unknown fields and non-integer values"""
+    good = ["ITEM_ID: potion", "NAME: Potion", "TYPE: consumable",
+            "EFFECT: health:5", "COST: 5", "DESCRIPTION: Heals"]
+    assert game_data.parse_item_block(good)['cost'] == 5
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(good + ["COLOR: red"])
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(good[:4] + ["COST: lots", good[5]])
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(good[:-1])
+
+def test_malformed_item_effect_rejected_at_load():
+    """Test that a bad EFFECT is an InvalidDataFormatError when parsing"""
+    block = ["ITEM_ID: charm", "NAME: Charm", "TYPE: armor",
+             "EFFECT: strength", "COST: 5", "DESCRIPTION: Broken"]
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(block)
+
 # ============================================================================
 # COMBAT EXCEPTION TESTS
 # ============================================================================
@@ -40,6 +40,315 @@ def test_character_creation_and_saving():
     # Cleanup
     character_manager.delete_character("IntegrationTest")
 
+def test_save_queue_coalesces_and_flushes(tmp_path):
+    """Test that queued saves are coalesced and written on flush"""
+    queue = character_manager.SaveQueue(str(tmp_path))
+    char = character_manager.create_character("QueueTest", "Rogue")
+
+    queue.enqueue(char)
+    char['gold'] = 999
+    queue.enqueue(char)
+    char['gold'] = 5  # Changes after enqueue are not part of the snapshot
+
+    assert queue.flush() == True
+    assert queue.pending_count() == 0
+    loaded = character_manager.load_character("QueueTest", str(tmp_path))
+    assert loaded['gold'] == 999
+
+    # Direct saves can run alongside the worker without clobbering it
+    for gold in range(50):
+        char['gold'] = gold
+        queue.enqueue(char)
+        character_manager.save_character(char, str(tmp_path))
+    assert queue.flush() == True
+    assert character_manager.load_character("QueueTest", str(tmp_path))['gold'] == 49
+    queue.close()
+
+def test_journaled_saves_append_and_compact(tmp_path):
+    """Test that journaled saves append deltas, replay, and compact"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("JournalTest", "Mage")
+    character_manager.save_character(char, save_dir, journal=True)
+
+    journal_file = tmp_path / "JournalTest.journal"
+    char['gold'] = 150
+    character_manager.save_character(char, save_dir, journal=True)
+    char['inventory'].append("health_potion")
+    character_manager.save_character(char, save_dir, journal=True)
+
+    assert len(journal_file.read_text().splitlines()) == 2
+    assert "GOLD: 100" in (tmp_path / "JournalTest.txt").read_text()
+
+    loaded = character_manager.load_character("JournalTest", save_dir)
+    assert loaded['gold'] == 150
+    assert loaded['inventory'] == ["health_potion"]
+
+    for gold in range(character_manager.JOURNAL_MAX_ENTRIES):
+        char['gold'] = gold
+        character_manager.save_character(char, save_dir, journal=True)
+
+    # The journal was folded into the snapshot once it hit the entry limit
+    assert len(journal_file.read_text().splitlines()) < character_manager.JOURNAL_MAX_ENTRIES
+    assert "GOLD: 100" not in (tmp_path / "JournalTest.txt").read_text()
+    assert character_manager.load_character("JournalTest", save_dir)['gold'] == char['gold']
+
+    # Journaled saves of one character from several threads stay consistent
+    from concurrent.futures import ThreadPoolExecutor
+    snapshots = []
+    for gold in range(1000, 1000 + 2 * character_manager.JOURNAL_MAX_ENTRIES):
+        snapshot = char.copy()
+        snapshot['gold'] = gold
+        snapshots.append(snapshot)
+    save = lambda c: character_manager.save_character(c, save_dir, journal=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(save, snapshots))
+    assert 1000 <= character_manager.load_character("JournalTest", save_dir)['gold'] < 1100
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # A torn append is skipped on load and trimmed before the next append
+    char = character_manager.load_character("JournalTest", save_dir)
+    with open(journal_file, "a") as f:
+        f.write('{"gold":16')
+    assert character_manager.load_character("JournalTest", save_dir)['gold'] == char['gold']
+    for gold in (200, 300):
+        char['gold'] = gold
+        character_manager.save_character(char, save_dir, journal=True)
+        assert character_manager.load_character("JournalTest", save_dir)['gold'] == gold
+    assert '{"gold":16' not in journal_file.read_text()
+
+    character_manager.delete_character("JournalTest", save_dir)
+    assert not journal_file.exists()
+
+def test_sqlite_storage_backend_and_migration(tmp_path):
+    """Test migrating text saves into SQLite and using it as the backend"""
+    import sqlite_storage
+
+    save_dir = str(tmp_path / "saves")
+    for name, char_class in [("Ann", "Warrior"), ("Bob", "Cleric")]:
+        char = character_manager.create_character(name, char_class)
+        char['inventory'] = ["health_potion", "iron_sword"]
+        character_manager.save_character(char, save_dir)
+
+    storage = sqlite_storage.SQLiteStorage(str(tmp_path / "saves.db"))
+    assert sqlite_storage.migrate_text_saves(save_dir, storage) == 2
+
+    previous = character_manager.set_storage_backend(storage)
+    try:
+        assert character_manager.list_saved_characters() == ["Ann", "Bob"]
+        loaded = character_manager.load_character("Ann")
+        assert loaded == character_manager.TextFileStorage(save_dir).load_character("Ann")
+
+        loaded['gold'] = 7
+        character_manager.save_character(loaded)
+        assert character_manager.load_character("Ann")['gold'] == 7
+
+        character_manager.delete_character("Bob")
+        from custom_exceptions import CharacterNotFoundError
+        with pytest.raises(CharacterNotFoundError):
+            character_manager.load_character("Bob")
+    finally:
+        character_manager.set_storage_backend(previous)
+        storage.close()
+
+    # Failed connects give their pool slot back
+    from custom_exceptions import SaveFileCorruptedError
+    db_path = str(tmp_path / "pool.db")
+    storage = sqlite_storage.SQLiteStorage(db_path, pool_size=2)
+    with storage._connection():
+        storage.db_path = str(tmp_path / "missing" / "pool.db")
+        for _ in range(3):
+            with pytest.raises(SaveFileCorruptedError):
+                with storage._connection():
+                    pass
+        storage.db_path = db_path
+        with storage._connection() as conn:
+            storage.close()
+    # A connection borrowed across close() is closed when returned
+    with pytest.raises(sqlite_storage.sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+def test_save_manifest_summaries(tmp_path):
+    """Test that the manifest tracks saves/deletes and can be rebuilt"""
+    save_dir = str(tmp_path)
+    for name, char_class, level in [("Cy", "Mage", 4), ("Al", "Warrior", 2), ("Bo", "Mage", 7)]:
+        char = character_manager.create_character(name, char_class)
+        char['level'] = level
+        character_manager.save_character(char, save_dir)
+    character_manager.delete_character("Cy", save_dir)
+
+    summaries = character_manager.query_saved_characters(save_dir)
+    assert [s['name'] for s in summaries] == ["Al", "Bo"]
+    assert summaries[1]['class'] == "Mage" and summaries[1]['level'] == 7
+
+    mages = character_manager.query_saved_characters(save_dir, character_class="Mage")
+    assert [s['name'] for s in mages] == ["Bo"]
+    page = character_manager.query_saved_characters(save_dir, sort_by="level", descending=True, limit=1)
+    assert [s['name'] for s in page] == ["Bo"]
+
+    (tmp_path / character_manager.MANIFEST_NAME).write_text("not json\n")
+    assert character_manager.rebuild_manifest(save_dir) == 2
+    assert [s['name'] for s in character_manager.query_saved_characters(save_dir)] == ["Al", "Bo"]
+
+def test_async_character_persistence(tmp_path):
+    """Test the asyncio persistence API with many concurrent saves"""
+    import asyncio
+    import async_character_manager
+
+    save_dir = str(tmp_path)
+    chars = [character_manager.create_character(f"Async{i}", "Rogue") for i in range(10)]
+
+    async def scenario():
+        await asyncio.gather(*(async_character_manager.save_character(c, save_dir) for c in chars))
+        names = await async_character_manager.list_saved_characters(save_dir)
+        loaded = await asyncio.gather(*(async_character_manager.load_character(n, save_dir) for n in names))
+        await async_character_manager.delete_character("Async0", save_dir)
+        return names, loaded
+
+    names, loaded = asyncio.run(scenario())
+    assert sorted(names) == sorted(c['name'] for c in chars)
+    assert all(c['class'] == "Rogue" for c in loaded)
+    assert "Async0" not in character_manager.list_saved_characters(save_dir)
+
+    # Many concurrent saves of the same character all succeed
+    async def same_character():
+        return await asyncio.gather(*(async_character_manager.save_character(chars[1], save_dir)
+                                      for _ in range(200)))
+
+    assert all(asyncio.run(same_character()))
+    assert character_manager.load_character("Async1", save_dir) == chars[1]
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # Cached saves keep Character records, not plain dicts
+    character_manager.enable_character_cache()
+    try:
+        asyncio.run(async_character_manager.save_character(chars[2], save_dir))
+        cached = character_manager.load_character("Async2", save_dir)
+        assert isinstance(cached, character_manager.Character)
+    finally:
+        character_manager.disable_character_cache()
+
+def test_binary_save_format_round_trip(tmp_path):
+    """Test that binary saves load back identically next to text saves"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("BinaryTest", "Warrior")
+    char['inventory'] = ["health_potion", "iron_sword", "health_potion"]
+    char['completed_quests'] = ["first_steps"]
+    char['gold'] = 12345
+
+    character_manager.save_character(char, save_dir, binary=True)
+    character_manager.save_character(character_manager.create_character("TextTest", "Mage"), save_dir)
+
+    raw = (tmp_path / "BinaryTest.txt").read_bytes()
+    assert raw.startswith(character_manager.BINARY_MAGIC)
+
+    loaded = character_manager.load_character("BinaryTest", save_dir)
+    assert loaded == {key: char[key] for key in character_manager.SAVE_FIELDS}
+    assert character_manager.load_character("TextTest", save_dir)['class'] == "Mage"
+
+def test_character_cache_write_back(tmp_path, monkeypatch):
+    """Test LRU hits, dirty write-back on eviction, and counters"""
+    save_dir = str(tmp_path)
+    cache = character_manager.enable_character_cache(capacity=2)
+    try:
+        for name in ["Cache1", "Cache2", "Cache3"]:
+            character_manager.save_character(character_manager.create_character(name, "Mage"), save_dir)
+
+        first = character_manager.load_character("Cache2", save_dir)
+        assert character_manager.load_character("Cache2", save_dir) is first
+
+        first['gold'] = 777
+        character_manager.save_character(first, save_dir)  # Only marked dirty
+        assert "GOLD: 100" in (tmp_path / "Cache2.txt").read_text()
+
+        character_manager.load_character("Cache1", save_dir)  # Evicts Cache3
+        character_manager.load_character("Cache3", save_dir)  # Evicts Cache2
+        assert "GOLD: 777" in (tmp_path / "Cache2.txt").read_text()
+
+        stats = cache.stats()
+        assert stats['hits'] >= 1 and stats['misses'] >= 2
+        assert stats['evictions'] >= 2 and stats['writebacks'] == 1
+
+        # A failed write-back keeps the dirty character cached for a retry
+        from custom_exceptions import SaveFileCorruptedError
+        third = character_manager.load_character("Cache3", save_dir)
+        third['gold'] = 333
+        character_manager.save_character(third, save_dir)
+        character_manager.load_character("Cache1", save_dir)  # Cache3 is now LRU
+
+        def failing_save(*args, **kwargs):
+            raise SaveFileCorruptedError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(character_manager, "_save_uncached", failing_save)
+            with pytest.raises(SaveFileCorruptedError):
+                character_manager.load_character("Cache2", save_dir)
+        assert character_manager.load_character("Cache3", save_dir) is third
+        character_manager.flush_character_cache()
+        assert "GOLD: 333" in (tmp_path / "Cache3.txt").read_text()
+    finally:
+        character_manager.disable_character_cache()
+
+def test_sharded_save_layout_migration(tmp_path):
+    """Test migrating flat saves to the sharded layout and resolving both"""
+    save_dir = str(tmp_path)
+    for i in range(5):
+        character_manager.save_character(character_manager.create_character(f"Hero{i}", "Cleric"), save_dir)
+    character_manager.save_character(character_manager.create_character("Journaled", "Mage"), save_dir, journal=True)
+
+    assert character_manager.migrate_to_sharded_layout(save_dir) == 6
+    assert not list(tmp_path.glob("*.txt"))
+    assert sorted(character_manager.iter_saved_characters(save_dir)) == \
+        sorted([f"Hero{i}" for i in range(5)] + ["Journaled"])
+
+    char = character_manager.load_character("Journaled", save_dir)
+    char['gold'] = 7
+    character_manager.save_character(char, save_dir, journal=True)
+    assert character_manager.load_character("Journaled", save_dir)['gold'] == 7
+    assert len(list(tmp_path.glob("*/*/Journaled.*"))) == 2
+
+    # Copies left in both layouts: migrating again keeps the newer one
+    for name, gold, age in [("Hero1", 999, -100), ("Hero2", 5, 100)]:
+        stale = character_manager.load_character(name, save_dir)
+        stale['gold'] = gold
+        flat_file = tmp_path / f"{name}.txt"
+        flat_file.write_text(character_manager._format_text_save(stale))
+        shard_mtime = os.path.getmtime(character_manager._sharded_save_path(save_dir, name))
+        os.utime(flat_file, (shard_mtime - age, shard_mtime - age))
+    assert character_manager.migrate_to_sharded_layout(save_dir) == 1
+    assert not list(tmp_path.glob("*.txt"))
+    assert character_manager.load_character("Hero1", save_dir)['gold'] == 999
+    assert character_manager.load_character("Hero2", save_dir)['gold'] == 100
+    assert sorted(character_manager.list_saved_characters(save_dir)).count("Hero1") == 1
+
+    character_manager.delete_character("Hero0", save_dir)
+    assert "Hero0" not in character_manager.list_saved_characters(save_dir)
+    assert character_manager.rebuild_manifest(save_dir) == 5
+
+def test_character_record_behaves_like_dict(tmp_path):
+    """Test that Character keeps dictionary-style access and round-trips saves"""
+    import pickle
+
+    char = character_manager.create_character("Slotted", "Rogue")
+    assert isinstance(char, character_manager.Character)
+    assert char == dict(char) and len(char) == len(character_manager.SAVE_FIELDS)
+    assert char.get('equipped_weapon') is None and 'equipped_weapon' not in char
+    assert char.setdefault('equipped_weapon', "sword") == "sword"
+    char['buff'] = 3
+    assert char['buff'] == 3 and list(char)[-2:] == ['equipped_weapon', 'buff']
+    del char['buff']
+    with pytest.raises(KeyError):
+        char['buff']
+
+    copy = char.copy()
+    copy['gold'] = 1
+    assert char['gold'] == 100
+    assert pickle.loads(pickle.dumps(char)) == char
+
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("Slotted", str(tmp_path))
+    assert isinstance(loaded, character_manager.Character)
+    assert loaded == {k: v for k, v in char.items() if k != 'equipped_weapon'}
+
 def test_character_leveling_system():
     """Test that character leveling works correctly"""
     char = character_manager.create_character("LevelTest", "Mage")
@@ -54,6 +363,33 @@ def test_character_leveling_system():
     assert char['max_health'] > original_health
     assert char['health'] == char['max_health']  # Health restored on level up
 
+def test_large_experience_awards_and_batch_grants():
+    """Test that huge XP awards resolve in one step and batch grants skip the dead"""
+    import progression
+
+    char = character_manager.create_character("Veteran", "Warrior")
+    char['health'] = 1
+    character_manager.gain_experience(char, 100 * 999 * 1000 // 2 + 5)
+    assert char['level'] == 1000
+    assert char['experience'] == 5
+    assert char['max_health'] == 120 + 999 * 10
+    assert char['strength'] == 15 + 999 * 2
+    assert char['health'] == char['max_health']
+
+    # Event-sized awards resolve without walking or tabulating every level
+    huge = character_manager.create_character("Legend", "Warrior")
+    character_manager.gain_experience(huge, 10**21)
+    level = huge['level']
+    assert progression.experience_for_level(level) <= 10**21 < progression.experience_for_level(level + 1)
+    assert huge['experience'] == 10**21 - progression.experience_for_level(level)
+
+    alive = character_manager.create_character("Alive", "Mage")
+    fallen = character_manager.create_character("Fallen", "Rogue")
+    fallen['health'] = 0
+    assert progression.apply_experience_batch([alive, fallen], 350) == {"Alive": 2}
+    assert (alive['level'], alive['experience']) == (3, 50)
+    assert fallen['level'] == 1 and fallen['experience'] == 0
+
 def test_character_gold_management():
     """Test adding and spending gold"""
     char = character_manager.create_character("GoldTest", "Rogue")
@@ -104,6 +440,23 @@ def test_equipment_system():
     assert 'equipped_weapon' in char
     assert char['equipped_weapon'] == "iron_sword"
 
+def test_precompiled_item_effects():
+    """Test that catalog items apply effects compiled at load time"""
+    item = game_data.parse_item_block([
+        "ITEM_ID: war_charm", "NAME: War Charm", "TYPE: armor",
+        "EFFECT: strength:3,magic:2", "COST: 40", "DESCRIPTION: Two bonuses"
+    ])
+    assert item['effects'] == (("strength", 3), ("magic", 2))
+
+    char = character_manager.create_character("EffectTest", "Cleric")
+    original_strength = char['strength']
+    original_magic = char['magic']
+    inventory_system.add_item_to_inventory(char, "war_charm")
+    inventory_system.equip_armor(char, "war_charm", item)
+
+    assert char['strength'] == original_strength + 3
+    assert char['magic'] == original_magic + 2
+
 def test_shop_system():
     """Test buying and selling items"""
     char = character_manager.create_character("ShopTest", "Mage")
@@ -187,6 +540,28 @@ def test_quest_prerequisite_system():
     quest_handler.accept_quest(char, 'second_quest', quests)
     assert 'second_quest' in char['active_quests']
 
+def test_columnar_catalog_queries_match_dict_queries():
+    """Test that columnar quest/item catalogs give the same query results"""
+    import columnar_catalog
+
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+    quest_columns = columnar_catalog.columnar_quests(quests)
+    item_columns = columnar_catalog.columnar_items(items)
+
+    char = character_manager.create_character("ColumnTest", "Mage")
+    char['level'] = 3
+    char['completed_quests'] = ['first_steps']
+
+    assert (quest_handler.get_quests_by_level(quest_columns, 2, 4)
+            == quest_handler.get_quests_by_level(quests, 2, 4))
+    assert (quest_handler.get_available_quests(char, quest_columns)
+            == quest_handler.get_available_quests(char, quests))
+    assert (quest_handler.get_total_quest_rewards_earned(char, quest_columns)
+            == quest_handler.get_total_quest_rewards_earned(char, quests))
+    assert (inventory_system.get_affordable_items(char, item_columns)
+            == inventory_system.get_affordable_items(char, items))
+
 # ============================================================================
 # COMBAT INTEGRATION TESTS
 # ============================================================================
@@ -204,6 +579,44 @@ def test_combat_system_basic_battle():
     assert battle.character == char
     assert battle.enemy == enemy
 
+def test_enemy_registry_spawns_by_level(tmp_path):
+    """Test that enemies come from the data file and spawn as independent copies"""
+    from custom_exceptions import InvalidDataFormatError
+
+    first = combat_system.create_enemy("Orc")
+    first['health'] = 0
+    assert combat_system.create_enemy("orc") == {
+        "name": "Orc", "type": "Orc", "health": 50, "max_health": 50,
+        "strength": 12, "magic": 2, "xp_reward": 20, "gold_reward": 12
+    }
+
+    expected = {0: None, 1: "Goblin", 2: "Goblin", 3: "Orc", 5: "Orc", 6: "Dragon", 500: "Dragon"}
+    for level, name in expected.items():
+        enemy = combat_system.get_random_enemy_for_level(level)
+        assert (enemy and enemy['name']) == name
+
+    bad_file = tmp_path / "enemies.txt"
+    blocks = []
+    for enemy_id, min_level, max_level in [("slime", 1, 4), ("wolf", 4, "NONE")]:
+        blocks.append(f"ENEMY_ID: {enemy_id}\nNAME: {enemy_id}\nTYPE: Beast\nHEALTH: 10\nSTRENGTH: 2\n"
+                      f"MAGIC: 0\nXP_REWARD: 1\nGOLD_REWARD: 1\nMIN_LEVEL: {min_level}\nMAX_LEVEL: {max_level}\n")
+    bad_file.write_text("\n".join(blocks))
+    with pytest.raises(InvalidDataFormatError):
+        combat_system.EnemyRegistry(game_data.load_enemies(str(bad_file)))
+
+    # An empty custom registry stays in place instead of reloading the default
+    from custom_exceptions import InvalidTargetError
+    empty_file = tmp_path / "no_enemies.txt"
+    empty_file.write_text("")
+    registry = combat_system.load_enemy_registry(str(empty_file))
+    try:
+        with pytest.raises(InvalidTargetError):
+            combat_system.create_enemy("orc")
+        assert combat_system.get_random_enemy_for_level(3) is None
+        assert combat_system.get_enemy_registry() is registry
+    finally:
+        combat_system.load_enemy_registry()
+
 def test_combat_victory_rewards():
     """Test that winning combat grants rewards"""
     char = character_manager.create_character("RewardTest", "Mage")
@@ -222,6 +635,120 @@ def test_combat_victory_rewards():
     assert rewards['xp'] == expected_xp
     assert rewards['gold'] == expected_gold
 
+def test_headless_battle_with_strategies():
+    """Test that strategy-driven battles run to completion and emit events"""
+    char = character_manager.create_character("Headless", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    battle = combat_system.SimpleBattle(char, enemy, player_strategy=combat_system.always_attack)
+
+    result = battle.start_battle()
+    assert result == {'winner': 'player', 'xp_gained': 10, 'gold_gained': 5}
+    assert not battle.combat_active
+    assert [e['damage'] for e in battle.events if e['actor'] == 'player'] == [14, 14, 14]
+    assert battle.events[-1]['enemy_health'] == 0
+    assert char['health'] == 120 - 2 * 2
+
+    sink = []
+    stalemate = combat_system.SimpleBattle(
+        character_manager.create_character("Healer", "Cleric"), combat_system.create_enemy("goblin"),
+        player_strategy=lambda b: "special", event_sink=sink.append, max_turns=5)
+    assert stalemate.start_battle()['winner'] == "none"
+    assert len(sink) == 10 and not stalemate.events
+
+    runner = combat_system.SimpleBattle(
+        character_manager.create_character("Runner", "Rogue"), combat_system.create_enemy("goblin"),
+        player_strategy=lambda b: "run")
+    assert runner.start_battle() == {'winner': 'none', 'xp_gained': 0, 'gold_gained': 0}
+
+def test_seeded_battle_replays_from_compact_log():
+    """Test that a seeded battle's packed log replays bit for bit"""
+    def coin_flip(battle):
+        return "special" if battle.rng.random() < 0.5 else "attack"
+
+    def fight(seed):
+        char = character_manager.create_character("Replay", "Rogue")
+        battle = combat_system.SimpleBattle(char, combat_system.create_enemy("orc"),
+                                            player_strategy=coin_flip, seed=seed)
+        return battle.start_battle(), battle.events
+
+    result, log = fight(1234)
+    assert fight(1234)[1].to_bytes() == log.to_bytes()
+    assert len(log) > 2 and log[0]['turn'] == 1 and log[-1]['actor'] in ("player", "enemy")
+
+    stored = combat_system.BattleLog.from_bytes(log.to_bytes())
+    assert stored == log and list(stored) == list(log)
+    replay_result, replay_log = combat_system.replay_battle(
+        character_manager.create_character("Replay", "Rogue"), combat_system.create_enemy("orc"),
+        stored.seed, stored.player_actions())
+    assert replay_result == result
+    assert replay_log.to_bytes() == log.to_bytes()
+
+    with pytest.raises(ValueError):
+        combat_system.BattleLog.from_bytes(b"not a log")
+
+def test_battle_simulator_is_deterministic_across_workers():
+    """Test that simulator reports match between in-process and pooled runs"""
+    import battle_simulator
+
+    args = dict(classes=["Warrior", "Mage"], levels=(1, 6), enemy_types=["goblin", "dragon"],
+                battles=25, seed=3)
+    serial = battle_simulator.run_simulation(max_workers=1, **args)
+    pooled = battle_simulator.run_simulation(max_workers=2, **args)
+    assert serial == pooled
+    assert len(serial) == 8
+
+    warrior_vs_goblin = serial[0]
+    assert (warrior_vs_goblin['class'], warrior_vs_goblin['enemy']) == ("Warrior", "goblin")
+    assert warrior_vs_goblin['win_rate'] == 1.0
+    assert sum(warrior_vs_goblin['turns'].values()) == 25
+    assert 0 <= warrior_vs_goblin['hp_remaining_percentiles'][50] <= 100
+
+def _batch_battle_cases():
+    """Random (character, enemy, action) triples and their SimpleBattle outcomes"""
+    import random
+    import battle_simulator
+
+    rng = random.Random(5)
+    pairs = []
+    for _ in range(300):
+        char = battle_simulator._leveled_character(rng.choice(list(character_manager.CLASS_STATS)),
+                                                   rng.randint(1, 12))
+        char['health'] = rng.randint(1, char['max_health'])
+        pairs.append((char, combat_system.create_enemy(rng.choice(list(combat_system.get_enemy_registry()))),
+                      rng.choice(["attack", "special", "run"])))
+
+    expected = []
+    for char, enemy, action in pairs:
+        char, enemy = char.copy(), dict(enemy)
+        battle = combat_system.SimpleBattle(char, enemy, player_strategy=lambda b, a=action: a, max_turns=40)
+        expected.append((battle.start_battle(), char['health'], enemy['health']))
+    return pairs, expected
+
+def _resolve_batch(pairs):
+    import batch_combat
+
+    chars = [char.copy() for char, _, _ in pairs]
+    enemies = [dict(enemy) for _, enemy, _ in pairs]
+    results = batch_combat.resolve_battles(chars, enemies, [a for _, _, a in pairs], max_turns=40)
+    return list(zip(results, [c['health'] for c in chars], [e['health'] for e in enemies]))
+
+def test_batch_combat_fallback_matches_scalar_battles(monkeypatch):
+    """Test that batch resolution without NumPy matches SimpleBattle"""
+    import batch_combat
+
+    pairs, expected = _batch_battle_cases()
+    monkeypatch.setattr(batch_combat, "np", None)
+    assert _resolve_batch(pairs) == expected
+
+def test_batch_combat_vectorized_matches_scalar_battles():
+    """Test that vectorized batch resolution matches SimpleBattle"""
+    pytest.importorskip("numpy")
+    import batch_combat
+
+    pairs, expected = _batch_battle_cases()
+    assert batch_combat.np is not None
+    assert _resolve_batch(pairs) == expected
+
 # ============================================================================
 # DATA LOADING INTEGRATION TESTS
 # ============================================================================
@@ -249,6 +776,128 @@ def test_load_game_data():
         assert 'type' in item
         assert 'cost' in item
 
+def test_streaming_loaders_match_dict_loaders():
+    """Test that iter_quests/iter_items yield the same records as load_*"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+
+    streamed_quests = list(game_data.iter_quests("data/quests.txt"))
+    streamed_items = list(game_data.iter_items("data/items.txt"))
+
+    assert [q['quest_id'] for q in streamed_quests] == list(quests)
+    assert [i['item_id'] for i in streamed_items] == list(items)
+    assert streamed_quests[0] == quests[streamed_quests[0]['quest_id']]
+
+def test_catalog_cache_rebuilds_when_stale(tmp_path):
+    """Test that the binary catalog cache is reused and refreshed on change"""
+    quest_file = tmp_path / "quests.txt"
+    quest_file.write_text(
+        "QUEST_ID: q1\nTITLE: One\nDESCRIPTION: d\nREWARD_XP: 10\n"
+        "REWARD_GOLD: 5\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n"
+    )
+
+    first = game_data.load_quests_cached(str(quest_file))
+    assert os.path.exists(str(quest_file) + game_data.CATALOG_CACHE_SUFFIX)
+    assert game_data.load_quests_cached(str(quest_file)) == first
+
+    quest_file.write_text(quest_file.read_text().replace("REWARD_XP: 10", "REWARD_XP: 99"))
+    os.utime(quest_file, ns=(0, 0))
+
+    assert game_data.load_quests_cached(str(quest_file))['q1']['reward_xp'] == 99
+
+def test_sharded_catalog_loading(tmp_path):
+    """Test loading quest shards from a directory or glob in parallel"""
+    shard_dir = tmp_path / "quests"
+    shard_dir.mkdir()
+    for quest_id in ["a", "b", "c"]:
+        (shard_dir / f"{quest_id}.txt").write_text(
+            f"QUEST_ID: {quest_id}\nTITLE: {quest_id}\nDESCRIPTION: d\nREWARD_XP: 10\n"
+            "REWARD_GOLD: 5\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n"
+        )
+
+    by_dir = game_data.load_quests(str(shard_dir), max_workers=2)
+    by_glob = game_data.load_quests(str(shard_dir / "*.txt"), max_workers=1)
+
+    assert list(by_dir) == ["a", "b", "c"]
+    assert by_dir == by_glob
+
+    # A bare glob skips the cache files written next to each shard
+    pattern = str(shard_dir / "*")
+    assert game_data.load_quests_cached(pattern, max_workers=1) == by_dir
+    assert game_data.load_quests_cached(pattern, max_workers=1) == by_dir
+    assert game_data.load_quests(pattern, max_workers=1) == by_dir
+
+    # The same quest_id in two shards is rejected
+    (shard_dir / "d.txt").write_text((shard_dir / "a.txt").read_text())
+    from custom_exceptions import InvalidDataFormatError
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(str(shard_dir), max_workers=1)
+
+def test_lazy_catalog_matches_eager_load(tmp_path):
+    """Test that LazyCatalog indexes every block and parses on access"""
+    from custom_exceptions import CorruptedDataError, InvalidDataFormatError
+    items = game_data.load_items("data/items.txt")
+
+    with game_data.open_lazy_items("data/items.txt") as lazy_items:
+        assert list(lazy_items) == list(items)
+        assert lazy_items._records == {}  # Nothing parsed yet
+
+        assert lazy_items['health_potion'] == items['health_potion']
+        assert list(lazy_items._records) == ['health_potion']
+        assert lazy_items.get('missing_item') is None
+
+    # Parsed records outlive close(); unparsed ones need the map
+    assert lazy_items['health_potion'] == items['health_potion']
+    with pytest.raises(ValueError):
+        lazy_items['iron_sword']
+
+    bad_file = tmp_path / "items.txt"
+    bad_file.write_bytes(b"ITEM_ID: \xff\xfe\nNAME: Bad\n")
+    with pytest.raises(CorruptedDataError):
+        game_data.open_lazy_items(str(bad_file))
+    bad_file.write_text("item_id: ok\nNAME: Ok\n\n  \nNAME: No id\n")
+    with pytest.raises(InvalidDataFormatError):
+        game_data.open_lazy_items(str(bad_file))
+
+def test_catalog_watcher_applies_block_changes(tmp_path):
+    """Test that the hot-reload watcher applies adds, updates and removals"""
+    def block(item_id, cost):
+        return (f"ITEM_ID: {item_id}\nNAME: {item_id}\nTYPE: consumable\n"
+                f"EFFECT: health:5\nCOST: {cost}\nDESCRIPTION: d\n")
+
+    item_file = tmp_path / "items.txt"
+    item_file.write_text(block("a", 1) + "\n" + block("b", 2))
+    items = game_data.load_items(str(item_file))
+    watcher = game_data.watch_items(items, str(item_file))
+
+    assert watcher.poll() is None
+
+    item_file.write_text(block("a", 10) + "\n" + block("c", 3))
+    os.utime(item_file, ns=(0, 0))
+    changes = watcher.poll()
+
+    assert changes == {'added': ['c'], 'updated': ['a'], 'removed': ['b']}
+    assert sorted(items) == ['a', 'c']
+    assert items['a']['cost'] == 10
+
+def test_loaded_records_are_slotted_mappings():
+    """Test that Quest/Item records keep read-only dictionary access"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+
+    quest = quests['first_steps']
+    assert isinstance(quest, game_data.Quest)
+    assert quest['title'] == quest.title
+    assert quest.get('missing_field', 'default') == 'default'
+    assert dict(quest)['reward_xp'] == quest['reward_xp']
+    assert not hasattr(quest, '__dict__')
+
+    item = items['health_potion']
+    assert isinstance(item, game_data.Item)
+    assert item['cost'] == 25
+    with pytest.raises(TypeError):
+        item['cost'] = 1
+
 def test_data_validation():
     """Test that data validation works"""
     valid_quest = {